@@ -2,7 +2,12 @@
 import streamlit as st
 import pandas as pd
 import random
-from scipy.stats import norm
+from cards import cards, field, group, note, number, progress, render, text
+from data_loader import LOL_FILES, load_board, load_cs2, load_correlations, load_lol_props, load_search_index, data_as_of, board_files, memory_report
+from instrument import instrumented, read_recent, summary
+from joint_probability import LOL_PRIOR, count_leg_probability, slip_probability
+from scoring import VALUE_RULES
+from slip_optimizer import optimize_slips
 
 # 🎨 Fonts: Orbitron (titles), Roboto (content)
 st.markdown("""
@@ -33,6 +38,36 @@ h1 {
     }
 }
 
+.pick-card {
+    background-color: #1a1a1a;
+    border-radius: 10px;
+    margin-bottom: 10px;
+}
+.pick-card summary {
+    cursor: pointer;
+    padding: 12px 15px;
+    font-weight: 500;
+}
+.pick-body {
+    padding: 0 15px 15px;
+}
+.pick-bar {
+    background-color: #333;
+    border-radius: 4px;
+    height: 8px;
+    margin: 10px 0 4px;
+    overflow: hidden;
+}
+.pick-bar span {
+    display: block;
+    height: 100%;
+    background-color: #89CFF0;
+}
+.pick-caption {
+    color: gray;
+    font-size: 14px;
+}
+
 .card-hover:hover {
     box-shadow: 0 0 20px #89CFF0;
     transform: scale(1.01);
@@ -75,153 +110,103 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-df_points = pd.read_csv("Final_Projections_POINTS.csv")
-df_rebounds = pd.read_csv("Final_Projections_REBOUNDS.csv")
-df_assists = pd.read_csv("Final_Projections_ASSISTS.csv")
-df_cs2 = pd.read_csv("SOLAR CS2 AI - Sheet1.csv")
-df_defense = pd.read_csv("defensive_ratings.csv")
-
-df_points["Category"] = "Points"
-df_rebounds["Category"] = "Rebounds"
-df_assists["Category"] = "Assists"
-df = pd.concat([df_points, df_rebounds, df_assists], ignore_index=True)
-
-df = df.merge(df_defense[['TEAM', 'DEF RTG', 'DEF RTG RANK']],
-              left_on='Opponent', right_on='TEAM', how='left')
-
-def get_best_bet(row):
-    if row["Edge"] > 0 and row["Best_Over_Odds"] <= -110:
-        return "Over", row["Best_Over_Odds"]
-    elif row["Edge"] < 0 and row["Best_Under_Odds"] <= -110:
-        return "Under", row["Best_Under_Odds"]
-    else:
-        return "Fade", None
-
-def calculate_confidence(row, best_odds):
-    edge_score = min(max(abs(row["Edge"]), 0), 1)
-    l10_diff = row["L10"] - row["Best_Line"]
-    l10_score = min(max(l10_diff / row["Best_Line"], 0), 1)
-    odds_score = 1 if best_odds >= -115 else 0.5 if best_odds >= -130 else 0.3
-
-    defense_penalty = 0
-    if not pd.isna(row.get("DEF RTG RANK")) and row["DEF RTG RANK"] <= 10:
-        defense_penalty = 0.2
-
-    confidence = (edge_score * 0.4 + l10_score * 0.4 + odds_score * 0.2)
-    confidence = confidence * (1 - defense_penalty)
-    return int(min(max(confidence * 100, 10), 100))
-
-def calculate_probability(row):
-    projection = row['AI_Projection']
-    line = row['Best_Line']
-    std_dev = row.get('STDDEV', 4.0)
-    z = (projection - line) / std_dev
-    prob_over = 1 - norm.cdf(z)
-    prob_under = norm.cdf(z)
-    return round(prob_over * 100), round(prob_under * 100)
-
-def matchup_note(row):
-    team = row.get("TEAM", "Unknown")
-    rank = row.get("DEF RTG RANK", None)
-    if pd.isna(rank) or pd.isna(team):
-        return "Matchup data unavailable"
-    rank = int(rank)
-    if rank >= 20:
-        return f"Great matchup ({team} #{rank})"
-    elif rank <= 10:
-        return f"Tough matchup ({team} #{rank})"
-    else:
-        return f"Neutral matchup ({team} #{rank})"
-
-def convert_odds(odds):
-    if odds is None:
-        return 0
-    if odds < 0:
-        return -100 / odds
-    else:
-        return odds / 100
-
-def adjusted_projection(row):
-    proj = row["AI_Projection"]
-
-    # Apply defensive adjustment
-    rank = row.get("DEF RTG RANK", None)
-    if not pd.isna(rank):
-        if rank <= 5:
-            proj *= 0.9  # Tough defense
-        elif rank >= 25:
-            proj *= 1.1  # Easy defense
-
-    # Use L5 if available to adjust projection
-    if "L5" in row and not pd.isna(row["L5"]):
-        proj = row["L5"] * 0.6 + row["L10"] * 0.4
-
-    return proj
-
-def is_valid_value_pick(row):
-    over_under, best_odds = get_best_bet(row)
-    if over_under == "Fade" or best_odds is None:
-        return False
-
-    # Calculate AI probability
-    prob_over, prob_under = calculate_probability(row)
-    prob = prob_over if over_under == "Over" else prob_under
-    if prob < 35:  # lower threshold slightly
-        return False
-
-    # Optional: only warn, don't block, cold streak
-    # if is_on_cold_streak(row): return False
-
-    return True
-
-def is_on_cold_streak(row):
-    last3 = row.get("Last3")
-    if isinstance(last3, list):
-        hits = [val >= row["Best_Line"] for val in last3]
-        return sum(hits) <= 1  # 0 or 1 hits in last 3 = cold streak
-    return False
+# Loaded and merged once per process; reloaded only when the pipeline rewrites the CSVs
+df = load_board()
+
+as_of = data_as_of(board_files())
+if as_of is not None:
+    st.caption(f"📅 Data as of {as_of:%b %d, %Y %I:%M %p}")
+
+# ?profile=1 writes a cProfile dump of the page render to profiles/
+def profile_requested():
+    return "profile" in st.query_params
+
+# "+1.0 (Over +3.5%)": line and Over-price movement since open, blank when it hasn't moved
+# or there is no odds history
+def line_moves(rows):
+    if "Line_Delta" not in rows.columns:
+        return pd.Series("", index=rows.index)
+    moves = number(rows["Line_Delta"], "{:+.1f}") + " (Over " + number(rows["Price_Delta"], "{:+.1f}") + "%)"
+    moved = (rows["Line_Delta"] != 0) | (rows["Price_Delta"] != 0)
+    return moves.where(rows["Line_Delta"].notna() & moved, "")
+
+# "Player – Over 24.5 Points"
+def pick_titles(rows):
+    return text(rows["Player"]) + " – " + text(rows["Bet"]) + " " + number(rows["Best_Line"]) + " " + text(rows["Category"])
+
+# NBA pick cards: projection, form, price, line move, matchup, cold streak and AI probability
+def nba_cards(rows):
+    return cards(
+        pick_titles(rows),
+        field("📊", "Projection", number(rows["AI_Projection"])),
+        field("🔟", "L10", number(rows["L10"])),
+        field("💰", "Odds", number(rows["Best_Odds"], "{:+.0f}")),
+        field("📈", "Line Move", line_moves(rows)),
+        field("🛡️", "Matchup", text(rows["Matchup"])),
+        note("⚠️ On a cold streak (1 or fewer hits in last 3)", rows["Cold_Streak"]),
+        progress(rows["AI_Prob"]),
+    )
+
+# LoL prop cards: line, projection, difference, team and side
+def lol_cards(rows):
+    return cards(
+        text(rows["Player"]) + " – " + text(rows["Type"]),
+        field("📊", "Line", text(rows["Line"])),
+        field("🤖", "Projection", number(rows["Proj"], "{:.2f}")),
+        field("📈", "Difference", number(rows["Diff"], "{:.2f}")),
+        field("🏅", "Team", text(rows["Team"]) + " (" + text(rows["TeamOdds"]) + ")"),
+        field("📉", "Bet", text(rows["Bet"])),
+    )
+
+# CS2 pick cards: L10 average and spread, hit rate, edge, team and AI probability
+def cs2_cards(rows):
+    spread = (" (± " + number(rows["STDDEV"]) + ")").where(rows["STDDEV"].notna(), "")
+    return cards(
+        pick_titles(rows),
+        field("📊", "L10 Average", number(rows["L10"]) + spread),
+        field("🎯", "Hit Rate L10", number(rows["Hit_Rate_L10"], "{:.0%}")),
+        field("📈", "Edge", number(rows["Edge"], "{:+.1f}")),
+        field("🏅", "Team", text(rows["Team"])),
+        progress(rows["AI_Prob"]),
+    )
 
 # --- Other functions omitted for brevity ---
 # Will send final completed script in parts if too large
 
+@instrumented("page:nba_search", profile=profile_requested)
 def player_search():
     st.title("NBA SEARCH")
 
-    all_players = sorted(df["Player"].unique())
+    search_index = load_search_index()
     typed = st.text_input("Start typing a player name (e.g. 'john'):").strip()
 
     if typed:
-        matching = [p for p in all_players if typed.lower() in p.lower()]
+        matching = search_index.search(typed)
         if matching:
             selected = st.selectbox("Matching players:", matching)
-            player_data = df[df["Player"] == selected]
+            player_rows = search_index.player_rows(selected)
 
             st.markdown("----")
             st.markdown(f"### {selected}")
 
-            for cat in ["Points", "Rebounds", "Assists"]:
-                stat = player_data[player_data["Category"] == cat]
-                if not stat.empty:
-                    row = stat.iloc[0]
-                    bet, odds = get_best_bet(row)
-
-                    st.markdown(f"#### {cat}")
-                    st.markdown(f"📊 Projection: {row['AI_Projection']:.1f} | 🔟 L10: {row['L10']:.1f} | 💰 Odds: {odds}  \n")
-
-                    if bet != "Fade" and odds is not None:
-                        prob_over, prob_under = calculate_probability(row)
-                        prob = prob_over if bet == "Over" else prob_under
-                        tough = row["DEF RTG RANK"] <= 5 if not pd.isna(row["DEF RTG RANK"]) else False
-
-                        st.markdown(f"**Best Bet:** {bet} {row['Best_Line']}")
-                        st.markdown(f"🤖 AI Probability: {prob}%")
-                        st.markdown(f"🛡️ {matchup_note(row)}{' 🔥 Tough Matchup!' if tough else ''}")
-                        st.progress(prob / 100)
-                    else:
-                        st.markdown("⚠️ No strong value detected for this prop.\n")
-
-
-
+            rows = df.iloc[[player_rows[cat] for cat in ["Points", "Rebounds", "Assists"] if cat in player_rows]]
+            bettable = (rows["Bet"] != "Fade") & rows["Best_Odds"].notna()
+            tough = rows["Tough_Matchup"].map({True: " 🔥 Tough Matchup!", False: ""})
+            render(cards(
+                text(rows["Category"]),
+                field("📊", "Projection", number(rows["AI_Projection"])),
+                field("🔟", "L10", number(rows["L10"])),
+                field("💰", "Odds", number(rows["Best_Odds"], "{:+.0f}")),
+                field("📈", "Line Move", line_moves(rows)),
+                field("🎯", "Best Bet", text(rows["Bet"]) + " " + number(rows["Best_Line"]), bettable),
+                field("🛡️", "Matchup", text(rows["Matchup"]) + tough, bettable),
+                note("⚠️ No strong value detected for this prop.", ~bettable),
+                progress(rows["AI_Prob"], bettable),
+                expanded=True,
+            ), key="nba_search")
+
+
+@instrumented("page:nba_value", profile=profile_requested)
 def best_props():
     st.title("NBA VALUE")
 
@@ -230,45 +215,33 @@ def best_props():
         df.nsmallest(3, "Best_Under_Odds")
     ])["Player"].unique()
 
-    df_filtered = df.copy()
-    df_filtered["Odds_Score"] = df_filtered.apply(
-        lambda row: convert_odds(get_best_bet(row)[1]), axis=1
-    )
-    df_filtered["Value_Score"] = df_filtered["Edge"] + (df_filtered["Odds_Score"] / 75)
-
-    def is_valid_value_pick(row):
-        over_under, best_odds = get_best_bet(row)
-        if over_under == "Fade" or best_odds is None:
-            return False
-        prob_over, prob_under = calculate_probability(row)
-        prob = prob_over if over_under == "Over" else prob_under
-        return prob >= 35
-
-    df_filtered = df_filtered[df_filtered.apply(is_valid_value_pick, axis=1)]
+    # Masks over the shared board: only the picked rows are ever copied
+    candidates = df["Valid_Value"] & ~df["Player"].isin(excluded_top_odds)
 
     selected_players = []
     used_opponents = []
 
     def select_best(category, min_line, max_odds, min_def_rank):
-        return df_filtered[
-            (df_filtered["Category"] == category) &
-            (df_filtered["Best_Line"] >= min_line) &
-            (df_filtered["Best_Over_Odds"] <= max_odds) &
-            (df_filtered["DEF RTG RANK"] > min_def_rank) &
-            (~df_filtered["Player"].isin(excluded_top_odds)) &
-            (~df_filtered["Player"].isin(selected_players)) &
-            (~df_filtered["Opponent"].isin(used_opponents))
-        ].nlargest(1, "Value_Score")
-
-    best_points = select_best("Points", 17.5, -110, 1)
+        mask = (
+            candidates &
+            (df["Category"] == category) &
+            (df["Best_Line"] >= min_line) &
+            (df["Best_Over_Odds"] <= max_odds) &
+            df["DEF RTG RANK"].gt(min_def_rank).fillna(False) &
+            (~df["Player"].isin(selected_players)) &
+            (~df["Opponent"].isin(used_opponents))
+        )
+        return df.loc[df.loc[mask, "Value_Score"].nlargest(1).index]
+
+    best_points = select_best("Points", *VALUE_RULES["Points"])
     selected_players += best_points["Player"].tolist()
     used_opponents += best_points["Opponent"].tolist()
 
-    best_rebounds = select_best("Rebounds", 4.0, -140, 1)
+    best_rebounds = select_best("Rebounds", *VALUE_RULES["Rebounds"])
     selected_players += best_rebounds["Player"].tolist()
     used_opponents += best_rebounds["Opponent"].tolist()
 
-    best_assists = select_best("Assists", 4.0, -135, 1)
+    best_assists = select_best("Assists", *VALUE_RULES["Assists"])
 
     best = pd.concat([best_points, best_rebounds, best_assists])
 
@@ -276,26 +249,9 @@ def best_props():
         st.warning("No value found.")
         return
 
-    for _, row in best.iterrows():
-        over_under, best_odds = get_best_bet(row)
-        prob_over, prob_under = calculate_probability(row)
-        ai_prob = prob_over if over_under == "Over" else prob_under
-        tough_matchup = row["DEF RTG RANK"] <= 5
-        cold_streak = is_on_cold_streak(row)
-        warning = "⚠️ On a cold streak (1 or fewer hits in last 3)" if cold_streak else ""
-
-        with st.expander(f"► {row['Player']} – {over_under} {row['Best_Line']} {row['Category']}"):
-            st.markdown(f'''
-                <div class='card-hover' style='background-color:#1a1a1a; padding:15px; border-radius:10px;'>
-                    📊 <strong>Projection:</strong> {row['AI_Projection']:.1f}<br>
-                    🔟 <strong>L10:</strong> {row['L10']:.1f}<br>
-                    💰 <strong>Odds:</strong> {best_odds}<br>
-                    🛡️ <strong>Matchup:</strong> {matchup_note(row)}<br>
-                    {warning}
-                </div>
-            ''', unsafe_allow_html=True)
-            st.progress(ai_prob / 100)
-            st.write(f"AI Probability: {ai_prob}%")
+    render(nba_cards(best), key="nba_value")
+
+@instrumented("page:nba_ai", profile=profile_requested)
 def generate_ai_2mans():
     st.title("NBA AI")
 
@@ -306,167 +262,52 @@ def generate_ai_2mans():
     bet_type = st.sidebar.selectbox('Bet Type', ["Both", "Overs Only", "Unders Only"])
     ignore_tough = st.sidebar.checkbox("Exclude Top 10 Defense Matchups")
 
-    df_filtered = df.copy()
-
-    # Category-specific minimum lines
-    def meets_line_threshold(row):
-        if row["Category"] == "Points":
-            return row["Best_Line"] >= 17.5
-        else:  # Rebounds or Assists
-            return row["Best_Line"] >= 4.0
-
-    df_filtered = df_filtered[df_filtered.apply(meets_line_threshold, axis=1)]
+    # Category-specific minimum lines (Points 17.5, Rebounds/Assists 4.0)
+    min_line = df["Category"].map({"Points": 17.5}).fillna(4.0)
+    mask = df["Best_Line"] >= min_line
     if pick_category != "All":
-        df_filtered = df_filtered[df_filtered["Category"] == pick_category]
-
-    df_filtered["Odds_Score"] = df_filtered.apply(lambda row: convert_odds(get_best_bet(row)[1]), axis=1)
-    df_filtered["Value_Score"] = df_filtered["Edge"] + (df_filtered["Odds_Score"] / 75)
-
-    def is_valid_two_man_pick(row):
-        bet, odds = get_best_bet(row)
-        if bet == "Fade" or odds is None:
-            return False
-        if odds > min_odds:
-            return False
-        if bet_type == "Overs Only" and bet != "Over":
-            return False
-        if bet_type == "Unders Only" and bet != "Under":
-            return False
-        if ignore_tough and not pd.isna(row.get("DEF RTG RANK")) and row["DEF RTG RANK"] <= 10:
-            return False
-        if "Last3" in row and isinstance(row["Last3"], list):
-            hits = [val >= row["Best_Line"] for val in row["Last3"]]
-            if sum(hits) <= 1:
-                return False
-        return True
-
-    df_filtered = df_filtered[df_filtered.apply(is_valid_two_man_pick, axis=1)]
-    df_filtered = df_filtered.sort_values(by="Value_Score", ascending=False)
-
-    pairs, attempts, used_players = [], 0, set()
-
-    while len(pairs) < 3 and len(df_filtered) >= num_players and attempts < 30:
-        sample = df_filtered.sample(num_players)
-        if any(player in used_players for player in sample["Player"]):
-            attempts += 1
-            continue
-        pairs.append(sample)
-        used_players.update(sample["Player"])
-        df_filtered = df_filtered[~df_filtered["Player"].isin(used_players)]
-        attempts += 1
+        mask &= df["Category"] == pick_category
+
+    mask &= (df["Bet"] != "Fade") & (df["Best_Odds"] <= min_odds)
+    if bet_type == "Overs Only":
+        mask &= df["Bet"] == "Over"
+    if bet_type == "Unders Only":
+        mask &= df["Bet"] == "Under"
+    if ignore_tough:
+        mask &= ~df["DEF RTG RANK"].le(10).fillna(False)
+    mask &= ~df["Cold_Streak"]
+
+    # Slips ranked with leg correlations from the game logs (opposing players, etc.)
+    correlations = load_correlations()
+    pairs = optimize_slips(df[mask], num_players,
+                           joint=lambda props, slips: slip_probability(props, slips, correlations))
 
     if not pairs:
         st.write("No picks match your filter criteria. Try adjusting your filters.")
         return
 
-    for i, slip in enumerate(pairs, 1):
-        st.subheader(f"SLIP {i}")
-        for _, player in slip.iterrows():
-            bet, odds = get_best_bet(player)
-            prob_over, prob_under = calculate_probability(player)
-            ai_prob = prob_over if bet == "Over" else prob_under
-            with st.expander(f"► {player['Player']} – {bet} {player['Best_Line']} {player['Category']}"):
-                st.markdown(f'''
-                    <div class='card-hover' style='background-color:#1a1a1a; padding:15px; border-radius:10px;'>
-                        📊 <strong>Projection:</strong> {player['AI_Projection']:.1f}<br>
-                        🔟 <strong>L10:</strong> {player['L10']:.1f}<br>
-                        💰 <strong>Odds:</strong> {odds}<br>
-                        🛡️ <strong>Matchup:</strong> {matchup_note(player)}
-                    </div>
-                ''', unsafe_allow_html=True)
-                st.progress(ai_prob / 100)
-                st.write(f"AI Probability: {ai_prob}%")
-
-def lol_value_props():
+    render([group(f"SLIP {i}", f"Hit chance {slip['joint_prob']:.0%} · Pays {slip['payout']:.2f}x · EV {slip['ev']:+.1%}",
+                  nba_cards(slip["legs"]))
+            for i, slip in enumerate(pairs, 1)], key="nba_ai")
+
+@instrumented("page:lol_value", profile=profile_requested)
+def lol_value_props(sheet=LOL_FILES[0]):
     st.title("LoL VALUE")
 
-    lol_df = pd.read_csv("SOLAR AI LoL - PROJ.csv")
-
-    all_rows = []
-
-    for _, row in lol_df.iterrows():
-        # Kills
-        if pd.notna(row["KILLS"]) and pd.notna(row["K PROJ."]):
-            diff = row["K PROJ."] - row["KILLS"]
-            all_rows.append({
-                "Player": row["PLAYER"],
-                "Team": row["TEAM"],
-                "Line": row["KILLS"],
-                "Proj": row["K PROJ."],
-                "Type": "Kills",
-                "Diff": diff,
-                "TeamOdds": row["TEAM ODDS"],
-                "Bet": "Over" if diff > 0 else "Under"
-            })
-        # Assists
-        if pd.notna(row["ASSISTS"]) and pd.notna(row["A PROJ."]):
-            diff = row["A PROJ."] - row["ASSISTS"]
-            all_rows.append({
-                "Player": row["PLAYER"],
-                "Team": row["TEAM"],
-                "Line": row["ASSISTS"],
-                "Proj": row["A PROJ."],
-                "Type": "Assists",
-                "Diff": diff,
-                "TeamOdds": row["TEAM ODDS"],
-                "Bet": "Over" if diff > 0 else "Under"
-            })
-
-    df_lol = pd.DataFrame(all_rows)
+    df_lol = load_lol_props(sheet)
 
     # Best Over & Under value
     over = df_lol[df_lol["Diff"] > 0].nlargest(1, "Diff")
     under = df_lol[df_lol["Diff"] < 0].nsmallest(1, "Diff")
     value_df = pd.concat([over, under])
 
-    for _, row in value_df.iterrows():
-        with st.expander(f"► {row['Player']}"):
-            st.markdown(f'''
-                <div class='card-hover' style='background-color:#1a1a1a; padding:15px; border-radius:10px;'>
-                    📊 <strong>Stat Type:</strong> {row['Type']}<br>
-                    🔢 <strong>Line:</strong> {row['Line']}<br>
-                    🤖 <strong>Projection:</strong> {row['Proj']:.2f}<br>
-                    📈 <strong>Difference:</strong> {row['Diff']:.2f}<br>
-                    🏅 <strong>Team:</strong> {row['Team']} ({row['TeamOdds']})<br>
-                    📉 <strong>Bet:</strong> {row['Bet']}
-                </div>
-            ''', unsafe_allow_html=True)
-
-def lol_2mans():
+    render(lol_cards(value_df), key="lol_value")
+
+@instrumented("page:lol_ai", profile=profile_requested)
+def lol_2mans(sheet=LOL_FILES[0]):
     st.title("LoL AI")
 
-    df_lol = pd.read_csv("SOLAR AI LoL - PROJ.csv")
-
-    all_rows = []
-    for _, row in df_lol.iterrows():
-        # Kills
-        if pd.notna(row["KILLS"]) and pd.notna(row["K PROJ."]):
-            diff = row["K PROJ."] - row["KILLS"]
-            all_rows.append({
-                "Player": row["PLAYER"],
-                "Team": row["TEAM"],
-                "Line": row["KILLS"],
-                "Proj": row["K PROJ."],
-                "Type": "Kills",
-                "Diff": diff,
-                "TeamOdds": row["TEAM ODDS"],
-                "Bet": "Over" if diff > 0 else "Under"
-            })
-        # Assists
-        if pd.notna(row["ASSISTS"]) and pd.notna(row["A PROJ."]):
-            diff = row["A PROJ."] - row["ASSISTS"]
-            all_rows.append({
-                "Player": row["PLAYER"],
-                "Team": row["TEAM"],
-                "Line": row["ASSISTS"],
-                "Proj": row["A PROJ."],
-                "Type": "Assists",
-                "Diff": diff,
-                "TeamOdds": row["TEAM ODDS"],
-                "Bet": "Over" if diff > 0 else "Under"
-            })
-
-    df_combined = pd.DataFrame(all_rows)
+    df_combined = load_lol_props(sheet)
 
     # Sort by absolute difference and mix top 5 Over and top 5 Under
     top_over = df_combined[df_combined["Diff"] > 0].nlargest(5, "Diff")
@@ -477,26 +318,86 @@ def lol_2mans():
         st.warning("No 2-man candidates found.")
         return
 
-    # Group in slips of 2
+    # Group in slips of 2, with each slip's hit chance under the LoL correlation prior
     num_slips = min(3, len(top_picks) // 2)
-    for i in range(num_slips):
-        st.subheader(f"SLIP {i+1}")
-        slip = top_picks.iloc[i*2:i*2+2]
-        for _, row in slip.iterrows():
-            with st.expander(f"► {row['Player']} – {row['Type']}"):
-                st.markdown(f'''
-                    <div class='card-hover' style='background-color:#1a1a1a; padding:15px; border-radius:10px;'>
-                        📊 <strong>Line:</strong> {row['Line']}<br>
-                        🤖 <strong>Projection:</strong> {row['Proj']:.2f}<br>
-                        📈 <strong>Difference:</strong> {row['Diff']:.2f}<br>
-                        🏅 <strong>Team:</strong> {row['Team']} ({row['TeamOdds']})<br>
-                        📉 <strong>Bet:</strong> {row['Bet']}
-                    </div>
-                ''', unsafe_allow_html=True)
+    top_picks["AI_Prob"] = count_leg_probability(top_picks["Proj"], top_picks["Line"], top_picks["Bet"])
+    slips = [[i * 2, i * 2 + 1] for i in range(num_slips)]
+    hit_chances = slip_probability(top_picks, slips, LOL_PRIOR, category_col="Type") if slips else []
+    render([group(f"SLIP {i+1}", f"Hit chance {hit_chances[i]:.0%}", lol_cards(top_picks.iloc[i*2:i*2+2]))
+            for i in range(num_slips)], key="lol_ai")
+
+
+# CS2 board, or None with an error shown when the sheet can't be loaded
+def cs2_board():
+    try:
+        return load_cs2()
+    except (OSError, ValueError) as e:
+        st.error(f"CS2 data unavailable: {e}")
+        return None
+
+@instrumented("page:cs2_value", profile=profile_requested)
+def cs2_value_props():
+    st.title("CS2 VALUE")
+
+    board = cs2_board()
+    if board is None:
+        return
+
+    pick_category = st.sidebar.selectbox('Stat', ["All", "Kills", "Headshots"])
+    picks = board[board["Valid_Value"] & ~board["Cold_Streak"]]
+    if pick_category != "All":
+        picks = picks[picks["Category"] == pick_category]
+
+    render(cs2_cards(picks.nlargest(10, "Value_Score")), key="cs2_value")
+
+@instrumented("page:cs2_ai", profile=profile_requested)
+def cs2_2mans():
+    st.title("CS2 AI")
+
+    board = cs2_board()
+    if board is None:
+        return
 
+    num_players = st.sidebar.selectbox('Players per slip', [2, 3, 4], index=0, key="cs2_legs")
+    pairs = optimize_slips(board[(board["Bet"] != "Fade") & ~board["Cold_Streak"]], num_players)
+
+    if not pairs:
+        st.write("No CS2 slips available.")
+        return
+
+    render([group(f"SLIP {i}", f"Hit chance {slip['joint_prob']:.0%} · Pays {slip['payout']:.2f}x · EV {slip['ev']:+.1%}",
+                  cs2_cards(slip["legs"]))
+            for i, slip in enumerate(pairs, 1)], key="cs2_ai")
+
+
+# Hidden page (?diagnostics=1): p50/p95 of recent page renders, data loads, pipeline
+# stages and API requests, from the timings file
+def diagnostics():
+    st.title("DIAGNOSTICS")
+
+    entries = read_recent()
+    st.caption(f"Last {len(entries)} timings")
+    table = summary(entries)
+    for prefix, label in [("page:", "Pages"), ("load:", "Data loads"), ("stage:", "Pipeline stages"), ("request:", "API requests")]:
+        rows = table[table["section"].str.startswith(prefix)]
+        if not rows.empty:
+            st.subheader(label)
+            st.dataframe(rows, hide_index=True)
+
+    # One board per process, shared by every session
+    memory = memory_report(df)
+    st.subheader("Board memory")
+    st.caption(f"{len(df)} props: {memory['bytes'].sum() / 1024:.0f} KB, "
+               f"{memory['unpacked_bytes'].sum() / 1024:.0f} KB as object strings / float64")
+    st.dataframe(memory, hide_index=True)
+
+
+if "diagnostics" in st.query_params:
+    diagnostics()
+    st.stop()
 
 # Sidebar navigation with single section active at a time
-section = st.sidebar.radio("Select Section", ["🏀 NBA", "🎮 League of Legends"])
+section = st.sidebar.radio("Select Section", ["🏀 NBA", "🎮 League of Legends", "🔫 CS2"])
 
 if section == "🏀 NBA":
     nba_page = st.sidebar.radio("NBA Pages", ["Search", "Value", "AI"], key="nba_menu")
@@ -510,11 +411,21 @@ if section == "🏀 NBA":
 
 elif section == "🎮 League of Legends":
     lol_page = st.sidebar.radio("LoL Pages", ["Value", "AI"], key="lol_menu")
+    lol_sheet = st.sidebar.selectbox("Projection sheet", LOL_FILES, key="lol_sheet",
+                                     format_func=lambda path: path.removeprefix("SOLAR AI LoL - ").removesuffix(".csv"))
 
     if lol_page == "Value":
-        lol_value_props()
+        lol_value_props(lol_sheet)
     elif lol_page == "AI":
-        lol_2mans()
+        lol_2mans(lol_sheet)
+
+elif section == "🔫 CS2":
+    cs2_page = st.sidebar.radio("CS2 Pages", ["Value", "AI"], key="cs2_menu")
+
+    if cs2_page == "Value":
+        cs2_value_props()
+    elif cs2_page == "AI":
+        cs2_2mans()
 
 
 # --- Footer ---
@@ -0,0 +1,293 @@
+# Backtest: replay past slates from the stored game logs through the projection blend,
+# score_board and the app's pick rules, and grade every pick against the box score.
+#
+#   python backtest.py                       # current settings on the L10 season
+#   python backtest.py --season 2023-24
+#   python backtest.py --sweep               # blend weight x odds cutoff grid, in a process pool
+#
+# Each game's board is rebuilt as the pipeline would have built it that morning: L10, L5,
+# STDDEV and Last_1..3 from the player's earlier games that season, H2H from the meetings
+# with the opponent last season (as build_l10_h2h takes it from H2H_SEASON). Lines are
+# that day's closing lines from the odds history where it has them, otherwise a proxy
+# line (the season-to-date mean, on the half point) at -110 both ways. Defense ranks are
+# today's defensive_ratings.csv.
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from game_logs import L10_SEASON, read_stored_logs
+from name_index import normalize_name
+from odds_history import HISTORY_FILE, daily_closing_lines
+from projection_models import L10_WEIGHT, blend_projection
+from scoring import MAX_BET_ODDS, VALUE_RULES, score_board
+from stat_types import STAT_TYPES
+
+DEFENSE_FILE = "defensive_ratings.csv"
+REPORT_FILE = "Backtest_Report.csv"
+CALIBRATION_FILE = "Backtest_Calibration.csv"
+SWEEP_FILE = "Backtest_Sweep.csv"
+
+MIN_GAMES = 5  # Earlier games in the season before a player's props are replayed
+PROXY_ODDS = -110
+CALIBRATION_BINS = list(range(0, 101, 10))  # AI_Prob buckets, in %
+BLEND_WEIGHTS = [0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+ODDS_CUTOFFS = [-100, -105, -110, -115, -120, -125, -130]
+
+
+# "2024-25" -> "2023-24"
+def previous_season(season):
+    start = int(season[:4]) - 1
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+# One row per (player, game, stat) of the season with what was known before tip-off, and
+# the Actual result
+def replay_history(season):
+    logs = read_stored_logs(season)
+    if logs is None:
+        raise ValueError(f"No stored {season} game logs: run l10_h2h_today.py to fill game_logs.db")
+    prior = read_stored_logs(previous_season(season))
+    games = logs if prior is None else pd.concat([prior, logs], ignore_index=True)
+    games["Opponent"] = games["MATCHUP"].str[-3:]
+
+    labels = {stat["key"]: stat["label"] for stat in STAT_TYPES.values()}
+    long = games.melt(id_vars=["SEASON_YEAR", "PLAYER_ID", "PLAYER_NAME", "GAME_ID", "GAME_DATE", "Opponent"],
+                      value_vars=list(labels), var_name="Category", value_name="Actual")
+    long["Category"] = long["Category"].map(labels)
+    long = long.dropna(subset=["Actual"])
+    long = long.sort_values(["PLAYER_ID", "Category", "GAME_DATE"], kind="stable").reset_index(drop=True)
+
+    # Form this season, from the games before each one
+    season_keys = ["PLAYER_ID", "Category", "SEASON_YEAR"]
+    this_season = long.groupby(season_keys, sort=False)["Actual"]
+    for n in (1, 2, 3):
+        long[f"Last_{n}"] = this_season.shift(n)
+    earlier = long.groupby(season_keys, sort=False)["Last_1"]
+    long["L10"] = earlier.rolling(10, min_periods=MIN_GAMES).mean().droplevel([0, 1, 2]).round(1)
+    long["L5"] = earlier.rolling(5, min_periods=MIN_GAMES).mean().droplevel([0, 1, 2])
+    long["STDDEV"] = earlier.rolling(10, min_periods=MIN_GAMES).std().droplevel([0, 1, 2]).round(2)
+    played = this_season.cumcount()
+    season_mean = (this_season.cumsum() - long["Actual"]) / played.where(played > 0)
+    long["Proxy_Line"] = np.floor(season_mean) + 0.5
+
+    # Meetings with the opponent last season only, like the pipeline's H2H
+    last_season = long[long["SEASON_YEAR"] != season]
+    h2h = last_season.groupby(["PLAYER_ID", "Category", "Opponent"])["Actual"].mean().round(1)
+    long = long.join(h2h.rename("H2H"), on=["PLAYER_ID", "Category", "Opponent"])
+
+    long = long[(long["SEASON_YEAR"] == season) & (played >= MIN_GAMES)]
+    long = long.rename(columns={"PLAYER_NAME": "Player"}).assign(Date=long["GAME_DATE"].str[:10])
+    return long.drop(columns=["SEASON_YEAR", "GAME_DATE"]).reset_index(drop=True)
+
+
+# Normalized player name -> the closing main line per (stat, day) in the odds history:
+# the line most books quote, with the best Over (most negative) and the Under closest to 0
+def closing_main_lines(quotes):
+    names = quotes["player"].unique()
+    quotes = quotes.assign(Player_Key=quotes["player"].map(dict(zip(names, map(normalize_name, names)))))
+    keys = ["Player_Key", "stat", "date"]
+
+    books = quotes[quotes["side"] == "Over"].groupby(keys + ["line"]).size().rename("Books").reset_index()
+    main = books.sort_values(keys + ["Books"], ascending=[True, True, True, False], kind="stable").drop_duplicates(keys)
+    on_main = quotes.merge(main[keys + ["line"]], on=keys + ["line"])
+
+    overs = on_main[on_main["side"] == "Over"].sort_values("price", kind="stable").drop_duplicates(keys)
+    unders = on_main[on_main["side"] == "Under"]
+    unders = unders.assign(distance=unders["price"].abs()).sort_values("distance", kind="stable").drop_duplicates(keys)
+    lines = overs.set_index(keys)[["line", "price"]].rename(columns={"line": "Best_Line", "price": "Best_Over_Odds"})
+    lines["Best_Under_Odds"] = unders.set_index(keys)["price"]
+    return lines
+
+
+# Best_Line and prices for every replayed prop: the day's closing main line when the odds
+# history has the prop, the proxy line at -110 otherwise (Line_Source says which)
+def attach_lines(history):
+    board = history.assign(Best_Line=history["Proxy_Line"], Best_Over_Odds=float(PROXY_ODDS),
+                           Best_Under_Odds=float(PROXY_ODDS), Line_Source="proxy")
+    quotes = daily_closing_lines() if os.path.exists(HISTORY_FILE) else None
+    if quotes is None or quotes.empty:
+        return board
+
+    names = history["Player"].unique()
+    keys = pd.MultiIndex.from_arrays([history["Player"].map(dict(zip(names, map(normalize_name, names)))),
+                                      history["Category"], history["Date"]])
+    found = closing_main_lines(quotes).reindex(keys)
+    has_line = found["Best_Line"].notna().to_numpy()
+    for col in ["Best_Line", "Best_Over_Odds", "Best_Under_Odds"]:
+        board.loc[has_line, col] = found[col].to_numpy()[has_line]
+    board.loc[has_line, "Line_Source"] = "history"
+    return board
+
+
+# Opponent defense, joined the way data_loader.build_board_from_csv does
+def add_defense(board):
+    if not os.path.exists(DEFENSE_FILE):
+        print(f"⚠️ {DEFENSE_FILE} not found, replaying without defense ranks.")
+        return board.assign(**{"DEF RTG": np.nan, "DEF RTG RANK": np.nan})
+    defense = pd.read_csv(DEFENSE_FILE)[["TEAM", "DEF RTG", "DEF RTG RANK"]]
+    return board.merge(defense, left_on="Opponent", right_on="TEAM", how="left").drop(columns="TEAM")
+
+
+# Project and score every replayed prop with the given settings
+def score(board, l10_weight=L10_WEIGHT, max_bet_odds=MAX_BET_ODDS):
+    board = board.assign(AI_Projection=blend_projection(board["L10"], board["H2H"], l10_weight))
+    board["Edge"] = board["AI_Projection"] - board["Best_Line"]
+    return score_board(board, max_bet_odds=max_bet_odds)
+
+
+# best_props on every slate at once: per day, the top Value_Score prop per category under
+# VALUE_RULES, skipping players with the day's 3 highest Over / 3 lowest Under prices,
+# and players and opponents already picked that day (Points, then Rebounds, then Assists)
+def value_picks(scored):
+    by_day = scored.groupby("Date")
+    top_odds = ((by_day["Best_Over_Odds"].rank(method="first", ascending=False) <= 3)
+                | (by_day["Best_Under_Odds"].rank(method="first") <= 3))
+    excluded = set(zip(scored.loc[top_odds, "Date"], scored.loc[top_odds, "Player"]))
+
+    candidates = scored[scored["Valid_Value"]]
+    picks, used_players, used_opponents = [], set(excluded), set()
+    for category, (min_line, max_odds, min_def_rank) in VALUE_RULES.items():
+        rows = candidates[
+            (candidates["Category"] == category) &
+            (candidates["Best_Line"] >= min_line) &
+            (candidates["Best_Over_Odds"] <= max_odds) &
+            (candidates["DEF RTG RANK"] > min_def_rank)
+        ]
+        player_keys = pd.MultiIndex.from_arrays([rows["Date"], rows["Player"]])
+        opponent_keys = pd.MultiIndex.from_arrays([rows["Date"], rows["Opponent"]])
+        rows = rows[~player_keys.isin(list(used_players)) & ~opponent_keys.isin(list(used_opponents))]
+        best = rows.loc[rows.groupby("Date")["Value_Score"].idxmax()]
+        picks.append(best)
+        used_players |= set(zip(best["Date"], best["Player"]))
+        used_opponents |= set(zip(best["Date"], best["Opponent"]))
+    return pd.concat(picks)
+
+
+# Pick rules graded by the backtest: name -> scored board -> picks
+RULES = {
+    "best_bet": lambda scored: scored[scored["Bet"] != "Fade"],  # every side score_board bets
+    "valid_value": lambda scored: scored[scored["Valid_Value"]],  # the AI pages' pool
+    "value_page": value_picks,  # the NBA Value page
+}
+
+
+# Result of every pick: Won, Push, Profit per unit staked at Best_Odds and AI_Prob as a
+# probability. Pushes are left out of hit rate, Brier score and calibration.
+def grade(picks):
+    actual, line = picks["Actual"].to_numpy(), picks["Best_Line"].to_numpy()
+    push = actual == line
+    won = np.where(picks["Bet"] == "Over", actual > line, actual < line) & ~push
+    odds = picks["Best_Odds"].to_numpy(dtype="float64")
+    with np.errstate(divide="ignore"):
+        payout = np.where(odds < 0, -100 / odds, odds / 100)
+    return picks.assign(Push=push, Won=won, Profit=np.where(push, 0.0, np.where(won, payout, -1.0)),
+                        Prob=picks["AI_Prob"] / 100)
+
+
+# Every rule's graded picks for one setting
+def graded_picks(board, l10_weight=L10_WEIGHT, max_bet_odds=MAX_BET_ODDS, rules=RULES):
+    scored = score(board, l10_weight, max_bet_odds)
+    return pd.concat([grade(rule(scored)).assign(Rule=name) for name, rule in rules.items()], ignore_index=True)
+
+
+# Picks, pushes, hit rate, ROI (profit per unit staked) and Brier score per group
+def summarize(graded, by):
+    decided = ~graded["Push"]
+    graded = graded.assign(Hit=graded["Won"].where(decided),
+                           Squared_Error=((graded["Prob"] - graded["Won"]) ** 2).where(decided))
+    table = graded.groupby(by).agg(Picks=("Profit", "size"), Pushes=("Push", "sum"), Hit_Rate=("Hit", "mean"),
+                                   ROI=("Profit", "mean"), Brier=("Squared_Error", "mean"))
+    return table.round(4).reset_index()
+
+
+# Per rule and category, plus each rule across categories ("All")
+def report(graded):
+    table = pd.concat([summarize(graded, ["Rule", "Category"]),
+                       summarize(graded, ["Rule"]).assign(Category="All")])
+    return table.sort_values(["Rule", "Category"], kind="stable").reset_index(drop=True)
+
+
+# Predicted (mean AI_Prob) against actual hit rate per rule and AI_Prob bucket
+def calibration(graded):
+    decided = graded[~graded["Push"]]
+    bucket = pd.cut(decided["AI_Prob"], CALIBRATION_BINS, include_lowest=True).astype(str)
+    table = decided.groupby([decided["Rule"], bucket.rename("AI_Prob_Bucket")], sort=False).agg(
+        Picks=("Won", "size"), Predicted=("Prob", "mean"), Hit_Rate=("Won", "mean"))
+    return table.round(4).reset_index().sort_values(["Rule", "AI_Prob_Bucket"], kind="stable")
+
+
+# Sweep workers get the replayed board once, when the pool starts them
+_board = None
+_rule = None
+
+
+def _init_worker(board, rule):
+    global _board, _rule
+    _board, _rule = board, rule
+
+
+def _sweep_point(params):
+    l10_weight, max_bet_odds = params
+    graded = graded_picks(_board, l10_weight, max_bet_odds, {_rule: RULES[_rule]})
+    table = summarize(graded, ["Rule"])
+    result = table.iloc[0].drop("Rule").to_dict() if len(table) else {"Picks": 0}  # No side that cheap
+    return {"L10_Weight": l10_weight, "Max_Bet_Odds": max_bet_odds, **result}
+
+
+# One rule's results for every (blend weight, odds cutoff), best ROI first. Proxy lines
+# are all priced at PROXY_ODDS, so the grid only grades props on closing lines from the
+# odds history; without any, it sweeps the blend weight alone with every proxy side allowed.
+def sweep(board, rule="valid_value", weights=BLEND_WEIGHTS, cutoffs=ODDS_CUTOFFS, workers=None):
+    on_history = board[board["Line_Source"] == "history"]
+    if len(on_history):
+        board = on_history
+        print(f"🔎 Sweeping the {len(board)} props on closing lines from the odds history")
+    else:
+        print(f"⚠️ No closing lines in the odds history: every prop is priced at {PROXY_ODDS}, "
+              f"so odds cutoffs can't be tested. Sweeping blend weights only.")
+        cutoffs = [PROXY_ODDS]
+    grid = list(product(weights, cutoffs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(board, rule)) as pool:
+        rows = list(pool.map(_sweep_point, grid))
+    return pd.DataFrame(rows).sort_values("ROI", ascending=False).reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Grade the projection and pick rules on past games")
+    parser.add_argument("--season", default=L10_SEASON)
+    parser.add_argument("--l10-weight", type=float, default=L10_WEIGHT, help="Blend share of L10 (rest H2H)")
+    parser.add_argument("--max-bet-odds", type=int, default=MAX_BET_ODDS, help="Only bet sides priced at or under this")
+    parser.add_argument("--sweep", action="store_true", help="Grid over --weights x --cutoffs instead")
+    parser.add_argument("--rule", default="valid_value", choices=list(RULES), help="Rule the sweep grades")
+    parser.add_argument("--weights", type=float, nargs="+", default=BLEND_WEIGHTS)
+    parser.add_argument("--cutoffs", type=int, nargs="+", default=ODDS_CUTOFFS)
+    parser.add_argument("--workers", type=int, help="Sweep processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    board = add_defense(attach_lines(replay_history(args.season)))
+    on_history = int((board["Line_Source"] == "history").sum())
+    print(f"📥 {len(board)} props replayed from {args.season} ({on_history} on closing lines from the odds history)")
+    if not on_history and not args.sweep:
+        capped = [category for category, (_, max_odds, _) in VALUE_RULES.items() if max_odds < PROXY_ODDS]
+        print(f"⚠️ Every prop is on a proxy line at {PROXY_ODDS}: the value page can't pick "
+              f"{', '.join(capped) or 'anything capped below it'}, and --max-bet-odds under {PROXY_ODDS} grades nothing.")
+
+    if args.sweep:
+        results = sweep(board, args.rule, args.weights, args.cutoffs, args.workers)
+        results.to_csv(SWEEP_FILE, index=False)
+        print(results.head(10).to_string(index=False))
+        print(f"✅ {len(results)} settings graded on '{args.rule}', saved to {SWEEP_FILE}")
+    else:
+        graded = graded_picks(board, args.l10_weight, args.max_bet_odds)
+        table = report(graded)
+        table.to_csv(REPORT_FILE, index=False)
+        calibration(graded).to_csv(CALIBRATION_FILE, index=False)
+        print(table.to_string(index=False))
+        print(f"✅ Saved {REPORT_FILE} and {CALIBRATION_FILE}")
+    print(f"⏱️ Done in {time.perf_counter() - start:.1f}s")
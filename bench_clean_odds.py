@@ -0,0 +1,80 @@
+# Benchmark: vectorized clean_odds.best_odds (per-line, with consensus) vs the original
+# per-player groupby.apply version
+#
+#   python bench_clean_odds.py [rows]
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from clean_odds import best_odds
+
+
+# The per-player implementation clean_odds.py used before best_odds (reading the player
+# from group.name: pandas 3 no longer passes the grouping column to apply)
+def legacy_best_odds(df):
+    def get_best_odds(group):
+        best_over = group[group["label"] == "Over"].nsmallest(1, "price")
+        best_under = group[group["label"] == "Under"]
+        best_under = best_under.loc[best_under["price"].abs().idxmin()] if not best_under.empty else None
+
+        return pd.DataFrame({
+            "Player": [group.name],
+            "Best_Over_Odds": [best_over["price"].values[0] if not best_over.empty else None],
+            "Best_Under_Odds": [best_under["price"] if best_under is not None else None],
+            "Best_Point": [group["point"].iloc[0]]
+        })
+
+    cleaned_df = df.groupby("description", group_keys=False).apply(get_best_odds).reset_index(drop=True)
+    cleaned_df["Best_Over_Odds"] = cleaned_df["Best_Over_Odds"].apply(lambda x: str(int(x)) if pd.notna(x) and x % 1 == 0 else str(x))
+    cleaned_df["Best_Under_Odds"] = cleaned_df["Best_Under_Odds"].apply(lambda x: str(int(x)) if pd.notna(x) and x % 1 == 0 else str(x))
+    cleaned_df["Best_Point"] = cleaned_df["Best_Point"].map(lambda x: f"{x:.1f}" if pd.notna(x) else "")
+    return cleaned_df
+
+
+# Synthetic odds dump: ~10 books x 5 lines x 2 sides per player
+def synthetic_odds(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    players = rows // 100
+    return pd.DataFrame({
+        "label": np.tile(["Over", "Under"], rows // 2),
+        "description": np.repeat([f"Player {i}" for i in range(players)], rows // players)[:rows],
+        "price": rng.integers(-300, 250, rows).astype(float),
+        "point": np.repeat(rng.choice([4.5, 10.5, 17.5, 24.5], rows // 2), 2),
+    })
+
+
+# What load_odds adds on top of the raw dump: quote ids pairing each Over with its Under
+def load_odds_frame(df):
+    return df.assign(book=np.nan, quote=(df["label"] == "Over").cumsum().astype(str))
+
+
+def timed(fn, df, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    df = synthetic_odds(rows)
+
+    legacy_seconds, _ = timed(legacy_best_odds, df)
+    new_seconds, new = timed(best_odds, load_odds_frame(df))
+
+    # With one line per player both versions must pick the same odds
+    single_line = df.assign(point=df.groupby("description")["point"].transform("first"))
+    legacy = legacy_best_odds(single_line)
+    new = best_odds(load_odds_frame(single_line))
+    assert (legacy["Player"] == new["Player"]).all()
+    assert (legacy["Best_Over_Odds"] == new["Best_Over_Odds"].astype(str)).all()
+    assert (legacy["Best_Under_Odds"] == new["Best_Under_Odds"].astype(str)).all()
+    assert (legacy["Best_Point"] == new["Best_Point"].map(lambda x: f"{x:.1f}")).all()
+
+    print(f"📊 {rows:,} rows, {df['description'].nunique():,} players")
+    print(f"   groupby.apply: {legacy_seconds * 1000:8.1f} ms")
+    print(f"   vectorized:    {new_seconds * 1000:8.1f} ms  ({legacy_seconds / new_seconds:.0f}x faster)")
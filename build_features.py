@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from game_logs import L10_SEASON, long_logs, read_stored_logs
+from name_index import resolve_players
+from stat_types import load_l10_h2h_long, load_odds_long
+
+# Player, Category and numeric game-log features for every prop on the slate
+FEATURES_FILE = "Player_Features.csv"
+LAST_N = 10  # Last_1 (most recent game) .. Last_10
+LAST_COLS = [f"Last_{i}" for i in range(1, LAST_N + 1)]
+
+
+# Rolling features for every (player, stat) from the raw game logs in one grouped pass:
+#   Last_1..Last_10     - the player's last 10 games, most recent first (NaN when fewer)
+#   L3, L5, L10_Mean    - means over the last 3/5/10 games
+#   STDDEV              - spread over the last 10 games
+#   Hit_Rate_L5/L10     - share of the last 5/10 games at or above the current line
+#   L3_Hits             - games at or above the line among the last 3
+def build_features(players, logs):
+    games = long_logs(logs)
+    games["Game"] = games.groupby(["PLAYER_ID", "Category"]).cumcount(ascending=False)
+    recent = games[games["Game"] < LAST_N]
+    last = recent.pivot_table(index=["PLAYER_ID", "Category"], columns="Game", values="Value")
+    last = last.reindex(columns=range(LAST_N))
+    last.columns = LAST_COLS
+
+    keys = pd.MultiIndex.from_arrays([players["PLAYER_ID"], players["Category"]])
+    values = last.reindex(keys).to_numpy()
+    line = players["Line"].to_numpy(dtype="float64")[:, None]
+    played = ~np.isnan(values)
+    hits = played & (values >= line)
+
+    features = players[["Player", "Category", "Line"]].reset_index(drop=True)
+    features[LAST_COLS] = values
+    games_played = features[LAST_COLS]
+    features["L3"] = games_played.iloc[:, :3].mean(axis=1).round(1)
+    features["L5"] = games_played.iloc[:, :5].mean(axis=1).round(1)
+    features["L10_Mean"] = games_played.mean(axis=1).round(1)
+    features["STDDEV"] = games_played.std(axis=1).round(2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hit_rate_l5 = hits[:, :5].sum(axis=1) / played[:, :5].sum(axis=1)
+        hit_rate_l10 = hits.sum(axis=1) / played.sum(axis=1)
+    # No line, no hit rate
+    has_line = ~np.isnan(line[:, 0])
+    features["Hit_Rate_L5"] = np.where(has_line, hit_rate_l5, np.nan).round(2)
+    features["Hit_Rate_L10"] = np.where(has_line, hit_rate_l10, np.nan).round(2)
+    features["L3_Hits"] = hits[:, :3].sum(axis=1)
+    return features
+
+
+if __name__ == "__main__":
+    logs = read_stored_logs(L10_SEASON)
+    if logs is None:
+        print("⚠️ No stored game logs, skipping features (run build_slate.py to fill game_logs.db)")
+        raise SystemExit(0)
+
+    # Every player on the slate, with the current line where there is one
+    players = load_l10_h2h_long()[["Player", "Category"]]
+    lines = load_odds_long()[["Player", "Category", "Best_Point"]].rename(columns={"Best_Point": "Line"})
+    players = players.merge(lines, on=["Player", "Category"], how="left")
+    player_ids = resolve_players(players["Player"].unique())
+    players["PLAYER_ID"] = players["Player"].map(player_ids)
+    players = players.dropna(subset=["PLAYER_ID"])
+
+    features = build_features(players, logs)
+    features.to_csv(FEATURES_FILE, index=False)
+    print(f"✅ Saved {FEATURES_FILE} ({len(features)} rows)")
@@ -0,0 +1,10 @@
+from data_loader import build_board_from_csv, compact_board, memory_report, publish_board, SCORED_BOARD_FILE
+
+# Final pipeline stage: merge, join defense and score every prop once, so the app
+# only has to filter and render.
+board = build_board_from_csv()
+publish_board(board)
+
+memory = memory_report(compact_board(board))
+print(f"✅ Scored board saved as: {SCORED_BOARD_FILE} ({len(board)} props, "
+      f"{memory['bytes'].sum() / 1024:.0f} KB in memory, {memory['unpacked_bytes'].sum() / 1024:.0f} KB unpacked)")
@@ -0,0 +1,79 @@
+import argparse
+from datetime import date, datetime, timedelta
+
+from nba_api.stats.endpoints import scoreboardv2
+
+from game_logs import build_l10_h2h
+from name_index import resolve_players, team_abbreviation
+from nba_fetch import HEADERS, call_with_retry, run_concurrently, timing_summary
+from stat_types import STAT_TYPES, l10_h2h_file
+
+# Output file stem -> stat suffix in the game logs
+CATEGORY_FILES = {l10_h2h_file(category)[:-len(".csv")]: stat["key"] for category, stat in STAT_TYPES.items()}
+SLATE_FILE = "Player_L10_H2H_Slate.csv"  # Every date in one table, with a Date column
+
+
+# Team id -> opponent team id for every game on a date
+def get_matchups(game_date):
+    scoreboard = call_with_retry(
+        lambda: scoreboardv2.ScoreboardV2(game_date=game_date.strftime('%m/%d/%Y'), headers=HEADERS),
+        f"ScoreboardV2 {game_date}",
+    )
+    games = scoreboard.get_normalized_dict()["GameHeader"]
+
+    matchups = {}
+    for game in games:
+        matchups[game["HOME_TEAM_ID"]] = game["VISITOR_TEAM_ID"]
+        matchups[game["VISITOR_TEAM_ID"]] = game["HOME_TEAM_ID"]
+    return matchups
+
+
+# Build L10/H2H for every date at once. The first date is written to the plain
+# Player_*_L10_H2H.csv files the rest of the pipeline reads; with several dates each
+# one also gets its own Player_*_L10_H2H_<date>.csv.
+def build_slate(dates, players_file="players.txt"):
+    with open(players_file, 'r') as file:
+        player_names = [line.strip() for line in file]
+    player_ids = resolve_players(player_names)
+
+    scoreboards = run_concurrently(get_matchups, dates)
+    slates = {d: m for d, m in zip(dates, scoreboards) if m is not None}
+    if not slates:
+        print("❌ No scoreboard could be fetched, keeping the existing L10/H2H files.")
+        return
+    slate = build_l10_h2h(player_ids, slates, team_abbreviation)
+
+    for stem, stat in CATEGORY_FILES.items():
+        columns = ["Player", "Team", "Opponent", f"L10_{stat}", f"H2H_{stat}"]
+        for i, d in enumerate(dates):
+            if d not in slates:
+                continue  # Its scoreboard failed: leave that date's files as they were
+            day = slate.loc[slate["Date"] == d, columns]
+            if i == 0:
+                day.to_csv(f"{stem}.csv", index=False)
+            if len(dates) > 1:
+                day.to_csv(f"{stem}_{d.isoformat()}.csv", index=False)
+
+    columns = ["Date", "Player", "Team", "Opponent"] + [f"{p}_{s}" for s in CATEGORY_FILES.values() for p in ("L10", "H2H")]
+    slate[columns].to_csv(SLATE_FILE, index=False)
+
+    print(f"⏱️ {timing_summary()}")
+    missing = [d.isoformat() for d in dates if d not in slates]
+    if missing:
+        print(f"⚠️ No scoreboard for {', '.join(missing)}, those files were not updated")
+    print(f"✅ Slate saved for {len(slates)} date(s): {', '.join(d.isoformat() for d in slates)}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build L10/H2H tables for one or more slate dates")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="First date (YYYY-MM-DD), default today")
+    parser.add_argument("--days", type=int, default=1, help="Number of consecutive dates")
+    parser.add_argument("--tomorrow", action="store_true", help="Start from tomorrow")
+    parser.add_argument("--players", default="players.txt")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    start = args.start or datetime.today().date() + timedelta(days=1 if args.tomorrow else 0)
+    build_slate([start + timedelta(days=i) for i in range(args.days)], args.players)
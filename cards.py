@@ -0,0 +1,74 @@
+import html
+from functools import reduce
+from operator import add
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZE = 25  # Cards (or slips) per page
+
+# Card markup, filled column-wise: every piece below is a string Series aligned with the
+# picks, so a page of cards is built with a few vectorized concatenations instead of a
+# Python f-string per pick. Cards are <details> elements, so they expand and collapse in
+# the browser without a rerun; the styles live in app.py's <style> block.
+CARD_START = '<details class="pick-card"><summary>► '
+CARD_START_OPEN = '<details class="pick-card" open><summary>► '
+CARD_BODY = '</summary><div class="card-hover pick-body">'
+CARD_END = '</div></details>'
+FIELD = '{icon} <strong>{label}:</strong> '
+BAR_START = '<div class="pick-bar"><span style="width:'
+BAR_END = '%"></span></div>'
+
+
+# HTML-escaped strings
+def text(values):
+    return values.astype(str).map(html.escape)
+
+
+# Numbers through a format spec ("{:.1f}", "{:+.0f}", "{:.0%}"), blank where missing
+def number(values, spec="{:.1f}"):
+    return pd.to_numeric(values, errors="coerce").map(spec.format, na_action="ignore").fillna("")
+
+
+# "icon Label: value" lines, left out where the value is blank or show is False
+def field(icon, label, values, show=None):
+    lines = FIELD.format(icon=icon, label=html.escape(label)) + values + "<br>"
+    keep = values != ""
+    return lines.where(keep if show is None else keep & show, "")
+
+
+# A line of text (already HTML) where show is True
+def note(content, show):
+    return pd.Series(np.where(show, content + "<br>", ""), index=show.index)
+
+
+# AI probability bar plus its label, from probabilities in %, where show is True
+def progress(probs, show=None):
+    pct = pd.to_numeric(probs, errors="coerce").clip(0, 100).fillna(0).astype(int).astype(str)
+    bars = BAR_START + pct + BAR_END + "AI Probability: " + pct + "%"
+    return bars if show is None else bars.where(show, "")
+
+
+# One card per row: the title and body pieces are string Series on the same index
+def cards(titles, *parts, expanded=False):
+    start = CARD_START_OPEN if expanded else CARD_START
+    return (start + titles + CARD_BODY + reduce(add, parts) + CARD_END).tolist()
+
+
+# A titled block of cards (e.g. one slip), as a single item for render()
+def group(title, caption, items):
+    return (f'<div class="pick-group"><h3>{html.escape(title)}</h3>'
+            f'<p class="pick-caption">{html.escape(caption)}</p>{"".join(items)}</div>')
+
+
+# Emit items as one HTML block; more than page_size get a page picker above it
+def render(items, key, page_size=PAGE_SIZE):
+    pages = max(1, -(-len(items) // page_size))
+    page = 1
+    if pages > 1:
+        page = st.selectbox("Page", range(1, pages + 1), key=f"{key}_page",
+                            format_func=lambda p: f"{p} of {pages}")
+    start = (page - 1) * page_size
+    st.markdown('<div class="pick-cards">' + "".join(items[start:start + page_size]) + "</div>",
+                unsafe_allow_html=True)
@@ -1,54 +1,128 @@
+import numpy as np
 import pandas as pd
 import os
 
+from odds_history import record_odds
+from stat_types import STAT_TYPES
+
 # List of files to process
 files = ["NBA STATS - POINTS.csv", "NBA STATS - ASSISTS.csv", "NBA STATS - REBOUNDS.csv"]
 
-# Function to process each file
-def process_file(file_path):
-    if not os.path.exists(file_path):
-        print(f"❌ File not found: {file_path}")
-        return None
-    
-    # Load the CSV file with manual column names
-    df = pd.read_csv(file_path, names=["label", "description", "price", "point"], header=None)
+
+# Load an odds dump (label, description, price, point[, book]) with numeric price and point.
+# Dumps without a book column list each book's quote as an Over row followed by its Under
+# row, so consecutive pairs are numbered as separate quotes.
+def load_odds(file_path):
+    df = pd.read_csv(file_path, names=["label", "description", "price", "point", "book"], header=None)
 
     # Standardize column names
     df.columns = df.columns.str.strip().str.lower()
 
+    # Drop header rows repeated by appended exports
+    df = df[df["label"].isin(["Over", "Under"])].copy()
+
     # Ensure price and point columns are numeric
     df["price"] = pd.to_numeric(df["price"], errors="coerce")
     df["point"] = pd.to_numeric(df["point"], errors="coerce")
 
-    # Function to extract the best odds
-    def get_best_odds(group):
-        best_over = group[group["label"] == "Over"].nsmallest(1, "price")  # Most negative Over odds
-        best_under = group[group["label"] == "Under"]
-        best_under = best_under.loc[best_under["price"].abs().idxmin()] if not best_under.empty else None  # Closest to 0 Under odds
+    df["quote"] = df["book"].where(df["book"].notna(), (df["label"] == "Over").cumsum().astype(str))
+    return df
+
+
+# Implied probability of American odds (vig included)
+def implied_probability(odds):
+    odds = np.asarray(odds, dtype="float64")
+    with np.errstate(divide="ignore"):
+        return np.where(odds < 0, -odds / (100 - odds), 100 / (odds + 100))
+
+
+# Best price per side for every (player, line), plus a vig-free consensus across books:
+#   Best_Over_Odds  - most negative Over price on the line
+#   Best_Under_Odds - Under price on the line closest to 0
+#   Best_*_Book     - book offering it (blank when the dump has no book column)
+#   Books           - number of quotes on the line
+#   Consensus_*_Prob - mean of each book's no-vig probability (over / (over + under))
+# Ties go to the first listed quote.
+def line_odds(df):
+    keys = ["description", "point"]
+    lines = df.drop_duplicates(keys).set_index(keys)[[]]
+    lines["Order"] = np.arange(len(lines))
+
+    overs = df[df["label"] == "Over"].dropna(subset=["price"])
+    best_over = overs.sort_values("price", kind="stable").drop_duplicates(keys).set_index(keys)
+
+    unders = df[df["label"] == "Under"].dropna(subset=["price"])
+    unders = unders.assign(distance=unders["price"].abs())
+    best_under = unders.sort_values("distance", kind="stable").drop_duplicates(keys).set_index(keys)
+
+    # One row per book quote with both sides, for the vig-free consensus
+    quotes = df.pivot_table(index=keys + ["quote"], columns="label", values="price", aggfunc="first")
+    quotes = quotes.reindex(columns=["Over", "Under"]).dropna()
+    p_over = implied_probability(quotes["Over"])
+    p_under = implied_probability(quotes["Under"])
+    quotes["Fair_Over"] = p_over / (p_over + p_under)
+    consensus = quotes.groupby(level=keys)["Fair_Over"].agg(["mean", "size"])
 
-        return pd.DataFrame({
-            "Player": [group["description"].iloc[0]],
-            "Best_Over_Odds": [best_over["price"].values[0] if not best_over.empty else None],
-            "Best_Under_Odds": [best_under["price"] if best_under is not None else None],
-            "Best_Point": [group["point"].iloc[0]]
-        })
+    lines["Best_Over_Odds"] = best_over["price"]
+    lines["Best_Over_Book"] = best_over["book"]
+    lines["Best_Under_Odds"] = best_under["price"]
+    lines["Best_Under_Book"] = best_under["book"]
+    lines["Books"] = consensus["size"].reindex(lines.index).fillna(0).astype(int)
+    lines["Consensus_Over_Prob"] = consensus["mean"].round(4)
+    lines["Consensus_Under_Prob"] = (1 - consensus["mean"]).round(4)
 
-    # Apply function to group by player
-    cleaned_df = df.groupby("description", group_keys=False).apply(get_best_odds).reset_index(drop=True)
+    # American odds are whole numbers: keep them as (nullable) ints so the CSV reads -110, not -110.0
+    for col in ["Best_Over_Odds", "Best_Under_Odds"]:
+        if (lines[col].dropna() % 1 == 0).all():
+            lines[col] = lines[col].astype("Int64")
 
-    # Save decimals for the line ("Best_Point")
-    cleaned_df["Best_Over_Odds"] = cleaned_df["Best_Over_Odds"].apply(lambda x: str(int(x)) if pd.notna(x) and x % 1 == 0 else str(x))
-    cleaned_df["Best_Under_Odds"] = cleaned_df["Best_Under_Odds"].apply(lambda x: str(int(x)) if pd.notna(x) and x % 1 == 0 else str(x))
-    cleaned_df["Best_Point"] = cleaned_df["Best_Point"].map(lambda x: f"{x:.1f}" if pd.notna(x) else "")
+    lines = lines.reset_index().rename(columns={"description": "Player", "point": "Line"})
+    return lines.sort_values(["Player", "Order"], kind="stable").reset_index(drop=True)
+
+
+# One row per player on the main line (the line quoted by the most books, first listed on
+# ties), with both sides' best prices taken from that same line.
+def best_odds(df):
+    return main_lines(line_odds(df))
+
+
+def main_lines(lines):
+    main = lines.sort_values(["Player", "Books", "Order"], ascending=[True, False, True], kind="stable")
+    main = main.drop_duplicates("Player").rename(columns={"Line": "Best_Point"})
+    return main[["Player", "Best_Over_Odds", "Best_Under_Odds", "Best_Point", "Best_Over_Book",
+                 "Best_Under_Book", "Books", "Consensus_Over_Prob", "Consensus_Under_Prob"]].reset_index(drop=True)
+
+
+# Function to process each file
+def process_file(file_path):
+    if not os.path.exists(file_path):
+        print(f"❌ File not found: {file_path}")
+        return None
+
+    df = load_odds(file_path)
+    category = file_path.replace('NBA STATS - ', '').replace('.csv', '')
+
+    # Keep this snapshot in the odds history before the cleaned files are overwritten
+    if category in STAT_TYPES:
+        appended = record_odds(df, STAT_TYPES[category]["label"], full=True)
+        print(f"📈 {appended} changed quote(s) added to the odds history")
+
+    # Every line with its best prices, then the main line per player
+    lines = line_odds(df)
+    lines.drop(columns="Order").to_csv(f"Cleaned_Odds_Lines_{category}.csv", index=False)
+    cleaned_df = main_lines(lines)
 
     # Generate output file name dynamically
-    output_file = f"Cleaned_Best_Odds_{file_path.replace('NBA STATS - ', '').replace('.csv', '')}.csv"
+    output_file = f"Cleaned_Best_Odds_{category}.csv"
     cleaned_df.to_csv(output_file, index=False)
 
     print(f"✅ Cleaned file saved as: {output_file}")
+    return cleaned_df
+
 
-# Process all files in the list
-for file in files:
-    process_file(file)
+if __name__ == "__main__":
+    # Process all files in the list
+    for file in files:
+        process_file(file)
 
-print("✅ All files processed successfully!")
+    print("✅ All files processed successfully!")
@@ -0,0 +1,77 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from scoring import score_board
+
+HISTORY_COLS = [str(i) for i in range(1, 11)]  # Last 10 matches, "1" the most recent
+REQUIRED_COLS = ["Player", "Team", "Line"] + HISTORY_COLS
+KILLS_SUFFIX = "(K)"  # "kraghen(K)" is a kills line, plain "kraghen" a headshots line
+
+# The sheet has lines but no prices: every leg is priced like a 2-pick pick'em paying 3x,
+# i.e. sqrt(3) per leg, which is -137 in American odds
+DEFAULT_ODDS = -137
+
+
+# An HTML page (e.g. a Google Sheets "edit" URL saved instead of its CSV export)
+def looks_like_html(text):
+    head = text.lstrip()[:1024].lower()
+    return head.startswith("<!doctype") or head.startswith("<html") or "<head>" in head
+
+
+# Read the CS2 sheet's CSV export, refusing HTML pages and files without the expected
+# columns, and dropping rows without a numeric line or any match history
+def load_cs2_sheet(path):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    if looks_like_html(text):
+        raise ValueError(f"{path} is an HTML page, not a CSV export of the sheet")
+
+    sheet = pd.read_csv(io.StringIO(text), on_bad_lines="skip")
+    sheet.columns = sheet.columns.astype(str).str.strip()
+    missing = [c for c in REQUIRED_COLS if c not in sheet.columns]
+    if missing:
+        raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+
+    numeric = ["Line"] + HISTORY_COLS
+    sheet[numeric] = sheet[numeric].apply(pd.to_numeric, errors="coerce")
+    sheet = sheet.dropna(subset=["Line"]).dropna(subset=HISTORY_COLS, how="all")
+    return sheet.reset_index(drop=True)
+
+
+# One board row per sheet row, in the NBA board's columns, scored by score_board.
+# Mean, spread, hit rate and edge come from the 10-match history as one NumPy matrix.
+def build_cs2_board(sheet):
+    history = sheet[HISTORY_COLS].to_numpy(dtype="float64")
+    line = sheet["Line"].to_numpy(dtype="float64")
+    played = ~np.isnan(history)
+    games = played.sum(axis=1)
+    filled = np.where(played, history, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = filled.sum(axis=1) / games
+        std = np.sqrt((np.where(played, history - mean[:, None], 0.0) ** 2).sum(axis=1) / (games - 1))
+        hit_rate = (played & (history >= line[:, None])).sum(axis=1) / games
+        l5 = filled[:, :5].sum(axis=1) / played[:, :5].sum(axis=1)
+
+    name = sheet["Player"].astype(str).str.strip()
+    is_kills = name.str.endswith(KILLS_SUFFIX)
+    board = pd.DataFrame({
+        "Player": name.str.removesuffix(KILLS_SUFFIX).str.strip(),
+        "Category": np.where(is_kills, "Kills", "Headshots"),
+        "Team": sheet["Team"].astype(str).str.strip(),
+        "Opponent": np.nan,
+        "Best_Line": line,
+        "AI_Projection": mean.round(2),
+        "L10": mean.round(2),
+        "L5": l5.round(2),
+        "STDDEV": std.round(2),
+        "Hit_Rate_L10": hit_rate.round(2),
+        "Best_Over_Odds": DEFAULT_ODDS,
+        "Best_Under_Odds": DEFAULT_ODDS,
+        "Edge": (mean - line).round(2),
+    })
+    for i, col in enumerate(HISTORY_COLS, 1):
+        board[f"Last_{i}"] = history[:, i - 1]
+    return score_board(board)
@@ -0,0 +1,193 @@
+import os
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from cs2_board import build_cs2_board, load_cs2_sheet
+from instrument import timed
+from lol_props import expand_props
+from scoring import score_board
+from search_index import SearchIndex
+
+# Files the NBA board is built from: the long table from merge_final_data.py, or the
+# older per-category files
+FINAL_PROJECTIONS_FILE = "Final_Projections.csv"
+PROJECTION_FILES = {
+    "Points": "Final_Projections_POINTS.csv",
+    "Rebounds": "Final_Projections_REBOUNDS.csv",
+    "Assists": "Final_Projections_ASSISTS.csv",
+}
+DEFENSE_FILE = "defensive_ratings.csv"
+SCORED_BOARD_FILE = "Scored_Board.parquet"  # Written by build_scored_board.py
+CS2_FILE = "SOLAR CS2 AI - Sheet1.csv"
+CS2_SCRAPED_FILE = "cs2_map1_2_stats.csv"  # scrape3's download of the "CS2 Map 1-2 Stats" tab
+LOL_FILES = ["SOLAR AI LoL - PROJ.csv", "SOLAR AI LoL - PROJ-2.csv"]  # Projection sheets, default first
+CORRELATIONS_FILE = "Leg_Correlations.csv"  # Written by joint_probability.py
+
+# Board schema, applied after scoring: repeated strings as categoricals, ranks and counts
+# as nullable small ints, every other number float32
+CATEGORICAL_COLS = ["Player", "Team", "Opponent", "Category", "Bet", "Matchup_Tier", "Matchup"]
+INT_COLS = {"DEF RTG RANK": "Int8", "Confidence": "Int8", "Books": "Int8", "L3_Hits": "Int8"}
+
+# One cache per process: Streamlit imports this module once, so every session shares it
+_cache = {}
+_lock = threading.RLock()  # Reentrant: building one cached value may load another
+
+
+# (path, mtime, size) for each input; missing files are kept so their creation busts the cache
+def file_signature(paths):
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+# Return the cached value for key, rebuilding it only when one of the files changed
+def cached(key, paths, build):
+    signature = file_signature(paths)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None or entry[0] != signature:
+            with timed(f"load:{key}"):
+                entry = (signature, build())
+            _cache[key] = entry
+    return entry[1]
+
+
+# Newest modification time among the files, for the "data as of" caption
+def data_as_of(paths):
+    mtimes = [mtime for _, mtime, _ in file_signature(paths) if mtime is not None]
+    if not mtimes:
+        return None
+    return datetime.fromtimestamp(max(mtimes) / 1e9)
+
+
+# The CSVs the board is scored from
+def csv_board_files():
+    if os.path.exists(FINAL_PROJECTIONS_FILE):
+        return [FINAL_PROJECTIONS_FILE, DEFENSE_FILE]
+    return list(PROJECTION_FILES.values()) + [DEFENSE_FILE]
+
+
+# The Parquet board and the CSVs, so rewriting either rebuilds the board
+def board_files():
+    return [SCORED_BOARD_FILE] + csv_board_files()
+
+
+# The Parquet board is used unless one of the CSVs was rewritten after it (e.g. the
+# merge ran without build_scored_board.py)
+def scored_board_is_current():
+    (_, board_mtime, _), *csvs = file_signature(board_files())
+    return board_mtime is not None and all(mtime is None or mtime <= board_mtime for _, mtime, _ in csvs)
+
+
+# Merge the projection CSVs with the defense table and score every prop
+def build_board_from_csv():
+    if os.path.exists(FINAL_PROJECTIONS_FILE):
+        df = pd.read_csv(FINAL_PROJECTIONS_FILE)
+    else:
+        frames = []
+        for category, path in PROJECTION_FILES.items():
+            frame = pd.read_csv(path)
+            frame["Category"] = category
+            frames.append(frame)
+        df = pd.concat(frames, ignore_index=True)
+
+    df_defense = pd.read_csv(DEFENSE_FILE)
+    df = df.merge(df_defense[['TEAM', 'DEF RTG', 'DEF RTG RANK']],
+                  left_on='Opponent', right_on='TEAM', how='left').drop(columns='TEAM')  # TEAM == Opponent
+    return score_board(df)
+
+
+# The board in its compact schema (idempotent; drops the defense merge's TEAM column)
+def compact_board(board):
+    board = board.drop(columns="TEAM", errors="ignore")
+    dtypes = {}
+    for col, dtype in board.dtypes.items():
+        if col in CATEGORICAL_COLS:
+            dtypes[col] = "category"
+        elif col in INT_COLS:
+            dtypes[col] = INT_COLS[col]
+        elif pd.api.types.is_float_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+            dtypes[col] = "float32"
+    return board.astype(dtypes)
+
+
+# What a column would take as plain object strings / float64 numbers
+def _unpacked_bytes(column):
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.astype(object).memory_usage(deep=True, index=False)
+    if pd.api.types.is_numeric_dtype(column.dtype) and not pd.api.types.is_bool_dtype(column.dtype):
+        return len(column) * 8
+    return column.memory_usage(deep=True, index=False)
+
+
+# Bytes per column (strings counted) next to their unpacked size, largest first
+def memory_report(board):
+    report = pd.DataFrame({
+        "column": board.columns,
+        "dtype": board.dtypes.astype(str).to_numpy(),
+        "bytes": board.memory_usage(deep=True, index=False).to_numpy(),
+        "unpacked_bytes": [_unpacked_bytes(board[col]) for col in board.columns],
+    })
+    return report.sort_values("bytes", ascending=False).reset_index(drop=True)
+
+
+# Write the scored board for the app in its compact schema, to a temporary file swapped
+# in with os.replace so readers never see a partial file
+def publish_board(board, path=SCORED_BOARD_FILE):
+    tmp_path = f"{path}.tmp"
+    compact_board(board).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _build_board():
+    if scored_board_is_current():
+        return compact_board(pd.read_parquet(SCORED_BOARD_FILE))
+    if os.path.exists(SCORED_BOARD_FILE):
+        print(f"⚠️ The projection CSVs are newer than {SCORED_BOARD_FILE}, scoring them in-process.")
+    else:
+        print(f"⚠️ {SCORED_BOARD_FILE} not found, scoring the projection CSVs in-process.")
+    return compact_board(build_board_from_csv())
+
+
+# Merged and scored NBA board: the precomputed Parquet board when the pipeline has
+# produced one since the projection CSVs last changed, otherwise built from the CSVs.
+# Shared between sessions: callers must not mutate it.
+def load_board():
+    return cached("board", board_files(), _build_board)
+
+
+# Player search over the board, rebuilt together with it
+def load_search_index():
+    return cached("search_index", board_files(), lambda: SearchIndex(load_board()))
+
+
+# LoL props from one of the projection sheets, one row per (player, stat)
+def load_lol_props(path=LOL_FILES[0]):
+    return cached(f"lol:{path}", [path], lambda: expand_props(pd.read_csv(path)))
+
+
+# CS2 sheet: scrape3's download when it is a usable CS2 sheet, otherwise CS2_FILE
+def _load_cs2_sheets():
+    try:
+        return load_cs2_sheet(CS2_SCRAPED_FILE)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Not using {CS2_SCRAPED_FILE} ({e}), reading {CS2_FILE}.")
+    return load_cs2_sheet(CS2_FILE)
+
+
+# Scored CS2 board; raises ValueError when neither sheet is a usable CSV export
+def load_cs2():
+    return cached("cs2", [CS2_SCRAPED_FILE, CS2_FILE], lambda: build_cs2_board(_load_cs2_sheets()))
+
+
+# Leg correlations estimated from the game logs, or None (legs treated as independent)
+def load_correlations():
+    return cached("correlations", [CORRELATIONS_FILE],
+                  lambda: pd.read_csv(CORRELATIONS_FILE) if os.path.exists(CORRELATIONS_FILE) else None)
@@ -0,0 +1,169 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from nba_fetch import fetch_season_logs
+from stat_types import STAT_TYPES
+
+L10_SEASON = "2024-25"
+H2H_SEASON = "2023-24"
+
+# Stat columns (L10_<key>/H2H_<key>) for every registered stat type
+STATS = [stat["key"] for stat in STAT_TYPES.values()]
+
+# Local game-log store: one row per (player, game), plus sync state per season
+STORE_FILE = "game_logs.db"
+LOG_COLUMNS = ["SEASON_YEAR", "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION",
+               "GAME_ID", "GAME_DATE", "MATCHUP", "MIN", "PTS", "REB", "AST", "FG3M", "STL", "BLK", "TOV"]
+RESYNC_AFTER = timedelta(hours=1)  # Same-day reruns of the current season skip the API
+
+
+def connect():
+    conn = sqlite3.connect(STORE_FILE)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS game_logs (
+            SEASON_YEAR TEXT, PLAYER_ID INTEGER, PLAYER_NAME TEXT, TEAM_ID INTEGER,
+            TEAM_ABBREVIATION TEXT, GAME_ID TEXT, GAME_DATE TEXT, MATCHUP TEXT, MIN REAL,
+            PTS REAL, REB REAL, AST REAL, FG3M REAL, STL REAL, BLK REAL, TOV REAL,
+            PRIMARY KEY (PLAYER_ID, GAME_ID)
+        )""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_game_logs_season ON game_logs (SEASON_YEAR, GAME_DATE)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS seasons (
+            season TEXT PRIMARY KEY, complete INTEGER, synced_at TEXT
+        )""")
+    return conn
+
+
+# A regular season is over once July of its second year arrives ("2023-24" -> July 2024)
+def season_is_complete(season, today=None):
+    today = today or datetime.today()
+    return today >= datetime(int(season[:4]) + 1, 7, 1)
+
+
+def _store_logs(conn, logs, season):
+    logs = logs.reindex(columns=LOG_COLUMNS)
+    logs["SEASON_YEAR"] = season
+    placeholders = ", ".join("?" for _ in LOG_COLUMNS)
+    conn.executemany(
+        f"INSERT OR REPLACE INTO game_logs ({', '.join(LOG_COLUMNS)}) VALUES ({placeholders})",
+        logs.astype(object).where(logs.notna(), None).itertuples(index=False, name=None),
+    )
+
+
+# Bring a season up to date: completed seasons are downloaded once and then served
+# from disk; the current season only fetches games since the last stored date.
+def sync_season(season):
+    conn = connect()
+    try:
+        state = conn.execute("SELECT complete, synced_at FROM seasons WHERE season = ?", (season,)).fetchone()
+        if state and state[0]:
+            return
+        if state and datetime.now() - datetime.fromisoformat(state[1]) < RESYNC_AFTER:
+            return
+
+        last_date = conn.execute(
+            "SELECT MAX(GAME_DATE) FROM game_logs WHERE SEASON_YEAR = ?", (season,)).fetchone()[0]
+        # Re-request the last stored day too, in case it was stored before every game finished
+        date_from = datetime.fromisoformat(last_date[:10]).strftime("%m/%d/%Y") if last_date else ""
+
+        print(f"📥 Syncing {season} game logs{f' since {date_from}' if date_from else ''}...")
+        try:
+            logs = fetch_season_logs(season, date_from)
+        except Exception as e:
+            if last_date is None:
+                raise
+            print(f"⚠️ Could not reach the API ({type(e).__name__}), using stored {season} logs.")
+            return
+
+        with conn:
+            _store_logs(conn, logs, season)
+            conn.execute("INSERT OR REPLACE INTO seasons VALUES (?, ?, ?)",
+                         (season, int(season_is_complete(season)), datetime.now().isoformat()))
+        print(f"✅ {len(logs)} {season} games stored in {STORE_FILE}")
+    finally:
+        conn.close()
+
+
+# League-wide logs for a season, synced and read from the local store
+def load_season_logs(season):
+    sync_season(season)
+    return read_stored_logs(season)
+
+
+# Logs already in the local store, without touching the API (None when there are none),
+# with a column per registered stat type (combined stats such as PRA are summed here)
+def read_stored_logs(season):
+    if not os.path.exists(STORE_FILE):
+        return None
+    conn = connect()
+    try:
+        logs = pd.read_sql_query("SELECT * FROM game_logs WHERE SEASON_YEAR = ?", conn, params=(season,))
+    finally:
+        conn.close()
+    if logs.empty:
+        return None
+    for stat in STAT_TYPES.values():
+        if stat["columns"] != [stat["key"]]:
+            logs[stat["key"]] = logs[stat["columns"]].sum(axis=1)
+    return logs
+
+
+# Game logs in long form (PLAYER_ID, Category, GAME_DATE, Value), oldest game first
+def long_logs(logs):
+    labels = {stat["key"]: stat["label"] for stat in STAT_TYPES.values()}
+    long = logs.melt(id_vars=["PLAYER_ID", "GAME_DATE"], value_vars=list(labels),
+                     var_name="Category", value_name="Value")
+    long["Category"] = long["Category"].map(labels)
+    return long.sort_values(["PLAYER_ID", "Category", "GAME_DATE"], kind="stable")
+
+
+# L10 averages and current team for every player, newest games first
+def last10_averages(logs):
+    logs = logs.sort_values(["PLAYER_ID", "GAME_DATE"], ascending=[True, False], kind="stable")
+    last10 = logs.groupby("PLAYER_ID").head(10)
+
+    agg = {f"L10_{stat}": (stat, "mean") for stat in STATS}
+    agg["Team_ID"] = ("TEAM_ID", "first")
+    averages = last10.groupby("PLAYER_ID").agg(**agg)
+    averages[[f"L10_{stat}" for stat in STATS]] = averages[[f"L10_{stat}" for stat in STATS]].round(1)
+    return averages
+
+
+# H2H averages for (PLAYER_ID, Opponent) pairs: games whose MATCHUP ("LAL vs. BOS",
+# "LAL @ BOS") involves the opponent. Pairs without a meeting get NaN.
+def h2h_averages(logs, pairs):
+    games = logs.merge(pairs, on="PLAYER_ID")
+    involved = (games["MATCHUP"].str[:3] == games["Opponent"]) | (games["MATCHUP"].str[-3:] == games["Opponent"])
+    averages = games[involved].groupby(["PLAYER_ID", "Opponent"])[STATS].mean().round(1)
+    averages.columns = [f"H2H_{stat}" for stat in STATS]
+    return pairs.merge(averages.reset_index(), on=["PLAYER_ID", "Opponent"], how="left")
+
+
+# L10/H2H table for every resolved player on each slate date. `slates` maps a date to its
+# matchups (team id -> opponent team id). L10 is computed once per player and H2H once per
+# (player, opponent) pair, then fanned out to every date the player plays.
+def build_l10_h2h(player_ids, slates, team_abbreviation):
+    roster = pd.DataFrame({"Player": list(player_ids), "PLAYER_ID": list(player_ids.values())})
+
+    l10 = last10_averages(load_season_logs(L10_SEASON))
+    roster = roster.merge(l10, left_on="PLAYER_ID", right_index=True, how="left")
+    for name in roster.loc[roster["Team_ID"].isna(), "Player"]:
+        print(f"⚠️ No L10 data for {name}, skipping.")
+    roster = roster.dropna(subset=["Team_ID"]).astype({"Team_ID": int})
+
+    days = []
+    for date, matchups in slates.items():
+        day = roster.assign(Date=date, Opponent_ID=roster["Team_ID"].map(matchups))
+        idle = day.loc[day["Opponent_ID"].isna(), "Player"].tolist()
+        if idle:
+            print(f"⚠️ No game on {date}: {', '.join(idle)}")
+        days.append(day.dropna(subset=["Opponent_ID"]))
+    slate = pd.concat(days, ignore_index=True)
+    slate["Team"] = slate["Team_ID"].map(team_abbreviation)
+    slate["Opponent"] = slate["Opponent_ID"].astype(int).map(team_abbreviation)
+
+    h2h = h2h_averages(load_season_logs(H2H_SEASON), slate[["PLAYER_ID", "Opponent"]].drop_duplicates())
+    return slate.merge(h2h, on=["PLAYER_ID", "Opponent"], how="left")
@@ -1,24 +1,32 @@
-import pandas as pd
+import argparse
 
-# Load L10 & H2H Data
-l10_h2h_points = pd.read_csv("Player_Points_L10_H2H.csv")
-l10_h2h_rebounds = pd.read_csv("Player_Rebounds_L10_H2H.csv")
-l10_h2h_assists = pd.read_csv("Player_Assists_L10_H2H.csv")
+from game_logs import L10_SEASON, read_stored_logs
+from name_index import resolve_players
+from projection_models import MODELS, run_model
+from stat_types import STAT_TYPES, load_l10_h2h_long
 
-# Function to calculate AI projection
-def calculate_projection(df, l10_col, h2h_col, category):
-    df["AI_Projection"] = (df[l10_col] * 0.6) + (df[h2h_col] * 0.4)  # 60% L10 + 40% H2H
-    df["Category"] = category  # Add Category column
-    return df[["Player", "AI_Projection", "Category"]]
+parser = argparse.ArgumentParser(description="Generate AI projections")
+parser.add_argument("--model", default="blend", choices=list(MODELS))
+args = parser.parse_args()
 
-# Generate AI projections
-ai_points = calculate_projection(l10_h2h_points, "L10_PTS", "H2H_PTS", "Points")
-ai_rebounds = calculate_projection(l10_h2h_rebounds, "L10_REB", "H2H_REB", "Rebounds")
-ai_assists = calculate_projection(l10_h2h_assists, "L10_AST", "H2H_AST", "Assists")
+# Load L10 & H2H Data for every category, plus the stored game logs (for STDDEV and ewm)
+players = load_l10_h2h_long()
+logs = read_stored_logs(L10_SEASON)
+if logs is None:
+    print("⚠️ No stored game logs, STDDEV left blank (the app assumes 4.0).")
+else:
+    player_ids = resolve_players(players["Player"].unique())
+    players["PLAYER_ID"] = players["Player"].map(player_ids)
+
+# Run the model over the whole player table at once
+projections = run_model(args.model, players, logs)
+players["AI_Projection"] = projections["AI_Projection"]
+players["STDDEV"] = projections["STDDEV"].round(2)
+players["Model"] = args.model
 
 # Save AI projections
-ai_points.to_csv("AI_Projections_POINTS.csv", index=False)
-ai_rebounds.to_csv("AI_Projections_REBOUNDS.csv", index=False)
-ai_assists.to_csv("AI_Projections_ASSISTS.csv", index=False)
+for category, stat in STAT_TYPES.items():
+    rows = players[players["Category"] == stat["label"]]
+    rows[["Player", "AI_Projection", "Category", "STDDEV", "Model"]].to_csv(f"AI_Projections_{category}.csv", index=False)
 
-print("✅ AI projections successfully generated!")
\ No newline at end of file
+print(f"✅ AI projections successfully generated with the '{args.model}' model!")
@@ -0,0 +1,113 @@
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+# Every timing is one JSON line: {"ts", "section", "seconds", "ok", ...extra fields}.
+# The app, the pipeline runner and the fetchers all append to the same file, so the
+# diagnostics page sees all of them. SOLAR_TIMINGS_FILE="" turns the file off.
+TIMINGS_FILE = os.environ.get("SOLAR_TIMINGS_FILE", "timings.jsonl")
+PROFILE_DIR = "profiles"
+PROFILE = os.environ.get("SOLAR_PROFILE") == "1"  # cProfile every page render / stage
+RECENT_SIZE = 2000
+
+recent = deque(maxlen=RECENT_SIZE)  # This process's timings, newest last
+_lock = threading.Lock()
+
+
+def record(section, seconds, ok=True, **fields):
+    entry = {
+        "ts": datetime.now().isoformat(timespec="milliseconds"),
+        "section": section,
+        "seconds": round(seconds, 4),
+        "ok": ok,
+        **fields,
+    }
+    with _lock:
+        recent.append(entry)
+        if TIMINGS_FILE:
+            with open(TIMINGS_FILE, "a") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+    return entry
+
+
+# with timed("load:board"): ...  records the block's wall time, and whether it raised
+@contextmanager
+def timed(section, **fields):
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        record(section, time.perf_counter() - start, ok, **fields)
+
+
+# @instrumented("page:nba_search") times every call of the function, and profiles it
+# when PROFILE is set or profile() (checked per call, e.g. a query parameter) says so
+def instrumented(section, profile=None):
+    def wrap(fn):
+        @functools.wraps(fn)
+        def call(*args, **kwargs):
+            enabled = PROFILE or (profile is not None and profile())
+            with profiled(section, enabled), timed(section):
+                return fn(*args, **kwargs)
+        return call
+    return wrap
+
+
+# cProfile the block into profiles/<name>-<timestamp>.prof when enabled
+# (open with `python -m pstats` or snakeviz)
+@contextmanager
+def profiled(name, enabled=PROFILE):
+    if not enabled:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        profiler.dump_stats(os.path.join(PROFILE_DIR, f"{safe_name}-{datetime.now():%Y%m%d-%H%M%S-%f}.prof"))
+
+
+# The last `limit` timings from the JSON-lines file (or this process's, without one)
+def read_recent(limit=RECENT_SIZE, path=None):
+    path = TIMINGS_FILE if path is None else path
+    if not path or not os.path.exists(path):
+        with _lock:
+            return list(recent)[-limit:]
+    entries = []
+    with open(path) as f:
+        for line in deque(f, maxlen=limit):
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # A line cut short by a concurrent writer
+    return entries
+
+
+# Count, p50, p95 and max seconds per section, slowest p95 first
+def summary(entries):
+    if not entries:
+        return pd.DataFrame(columns=["section", "count", "p50", "p95", "max", "failed"])
+    df = pd.DataFrame(entries)
+    grouped = df.groupby("section")["seconds"]
+    table = pd.DataFrame({
+        "count": grouped.size(),
+        "p50": grouped.quantile(0.5),
+        "p95": grouped.quantile(0.95),
+        "max": grouped.max(),
+        "failed": (~df["ok"].astype(bool)).groupby(df["section"]).sum(),
+    })
+    return table.sort_values("p95", ascending=False).round(4).reset_index()
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+from stat_types import STAT_TYPES
+
+CORRELATIONS_FILE = "Leg_Correlations.csv"  # Written by running this module
+SIMULATIONS = 10_000
+SEED = 7
+CHUNK_SLIPS = 128  # Slips simulated per batch: 128 x 10k x 4 legs of float32 is ~20 MB
+MIN_GAMES = 5  # Players with fewer games don't get a residual
+
+# How two legs relate; anything else is treated as independent
+RELATIONS = ["same_player", "teammate", "opponent"]
+
+# LoL has no game logs to estimate from, so its slips use this stated prior:
+# a player's kills and assists move together, teammates' kills feed each other's assists.
+LOL_PRIOR = pd.DataFrame([
+    ("same_player", "Kills", "Assists", 0.35),
+    ("teammate", "Kills", "Kills", 0.25),
+    ("teammate", "Kills", "Assists", 0.45),
+    ("teammate", "Assists", "Assists", 0.55),
+], columns=["Relation", "Stat_A", "Stat_B", "Rho"])
+
+
+# Probability (in %) of a count-stat leg hitting when all we have is a projection and a
+# line, as for LoL: normal around the projection with a Poisson-like spread (sqrt of line)
+def count_leg_probability(projection, line, bet):
+    spread = np.sqrt(np.clip(np.asarray(line, dtype="float64"), 1, None))
+    over = norm.cdf((np.asarray(projection, dtype="float64") - line) / spread)
+    return np.where(np.asarray(bet) == "Over", over, 1 - over) * 100
+
+
+# Pooled correlation of stat residuals from the game logs, per relation and stat pair.
+# A residual is a game's value minus the player's season mean, over the player's std:
+#   same_player - two stats of one player in the same game
+#   teammate    - stats of two players on the same team in the same game
+#   opponent    - stats of two players on opposite teams in the same game
+def estimate_correlations(logs):
+    labels = {stat["key"]: stat["label"] for stat in STAT_TYPES.values()}
+    keys = list(labels)
+    logs = logs[logs["MIN"] > 0]
+    logs = logs[logs.groupby("PLAYER_ID")["GAME_ID"].transform("size") >= MIN_GAMES]
+    by_player = logs.groupby("PLAYER_ID")[keys]
+    z = (logs[keys] - by_player.transform("mean")) / by_player.transform("std")
+    z = pd.concat([logs[["GAME_ID", "TEAM_ID", "PLAYER_ID"]], z], axis=1).dropna()
+
+    rows = []
+    same = z[keys].corr()
+    for a in keys:
+        for b in keys:
+            if a != b:
+                rows.append(("same_player", labels[a], labels[b], same.loc[a, b], len(z)))
+
+    pairs = z.merge(z, on="GAME_ID", suffixes=("_a", "_b"))
+    pairs = pairs[pairs["PLAYER_ID_a"] != pairs["PLAYER_ID_b"]]
+    same_team = pairs["TEAM_ID_a"] == pairs["TEAM_ID_b"]
+    for relation, subset in [("teammate", pairs[same_team]), ("opponent", pairs[~same_team])]:
+        for a in keys:
+            for b in keys:
+                rho = np.corrcoef(subset[f"{a}_a"], subset[f"{b}_b"])[0, 1]
+                rows.append((relation, labels[a], labels[b], rho, len(subset)))
+
+    table = pd.DataFrame(rows, columns=["Relation", "Stat_A", "Stat_B", "Rho", "Pairs"])
+    table["Rho"] = table["Rho"].round(4)
+    return table
+
+
+# Relation x stat x stat array of correlations (symmetric, 0 where the table has none)
+def correlation_array(table, categories):
+    codes = {category: i for i, category in enumerate(categories)}
+    rho = np.zeros((len(RELATIONS) + 1, len(categories), len(categories)), dtype="float32")
+    if table is None:
+        return rho
+    for row in table.itertuples(index=False):
+        if row.Relation in RELATIONS and row.Stat_A in codes and row.Stat_B in codes:
+            r, a, b = RELATIONS.index(row.Relation) + 1, codes[row.Stat_A], codes[row.Stat_B]
+            rho[r, a, b] = rho[r, b, a] = row.Rho
+    return rho
+
+
+# Column as integer codes (positions in `uniques` when given). Missing values get distinct
+# negative codes, offset by `start` so two coded columns can't collide on them either.
+def _codes(values, uniques=None, start=0):
+    codes = pd.Index(uniques).get_indexer(values) if uniques is not None else pd.factorize(values)[0]
+    codes = codes.astype("int64")
+    missing = codes < 0
+    codes[missing] = -1 - start - np.arange(missing.sum())
+    return codes
+
+
+# Correlation matrix of each slip's "leg hits" latents, shape (slips, legs, legs). Unders
+# flip the sign of their stat, so an Over and an Under on correlated stats pull apart.
+def slip_correlations(props, slips, table, player_col="Player", team_col="Team",
+                      opponent_col="Opponent", category_col="Category", side_col="Bet"):
+    categories = pd.unique(props[category_col])
+    rho = correlation_array(table, categories)
+    player = _codes(props[player_col])[slips]
+    category = _codes(props[category_col], categories)[slips]
+    side = np.where(props[side_col].to_numpy() == "Under", -1.0, 1.0)[slips]
+    team = opponent = None
+    if team_col in props.columns:
+        team_columns = [c for c in (team_col, opponent_col) if c in props.columns]
+        teams = pd.unique(pd.concat([props[c] for c in team_columns]).dropna())
+        team = _codes(props[team_col], teams)[slips]
+        if opponent_col in props.columns:
+            opponent = _codes(props[opponent_col], teams, start=len(props))[slips]
+
+    n, legs = slips.shape
+    corr = np.broadcast_to(np.eye(legs, dtype="float32"), (n, legs, legs)).copy()
+    for i in range(legs):
+        for j in range(i + 1, legs):
+            relation = np.zeros(n, dtype="int64")
+            if opponent is not None:
+                relation[(team[:, i] == opponent[:, j]) | (opponent[:, i] == team[:, j])] = 3
+            if team is not None:
+                relation[team[:, i] == team[:, j]] = 2
+            relation[player[:, i] == player[:, j]] = 1
+            value = rho[relation, category[:, i], category[:, j]] * side[:, i] * side[:, j]
+            corr[:, i, j] = corr[:, j, i] = value
+    return corr
+
+
+# Cholesky factors, nudging any matrix that isn't positive definite to the nearest one that is
+def _cholesky(corr):
+    try:
+        return np.linalg.cholesky(corr)
+    except np.linalg.LinAlgError:
+        values, vectors = np.linalg.eigh(corr)
+        fixed = vectors @ (np.clip(values, 1e-4, None)[..., None] * np.swapaxes(vectors, -1, -2))
+        scale = 1 / np.sqrt(np.diagonal(fixed, axis1=-2, axis2=-1))
+        return np.linalg.cholesky(fixed * scale[..., :, None] * scale[..., None, :])
+
+
+# Hit probability of every slip (rows of `slips`: positions into props, all the same
+# length) under a Gaussian copula: each leg hits with its own probability (prob_col, in %)
+# and legs are correlated per `table`. With table=None the legs are independent and the
+# exact product is returned. Otherwise all slips share the same seeded normal draws, so
+# results are reproducible and comparable across slips.
+def slip_probability(props, slips, table=None, simulations=SIMULATIONS, seed=SEED,
+                     prob_col="AI_Prob", **columns):
+    slips = np.asarray(slips)
+    prob = np.clip(pd.to_numeric(props[prob_col], errors="coerce").to_numpy(dtype="float64") / 100, 1e-6, 1 - 1e-6)
+    if slips.shape[1] == 1 or table is None:
+        return prob[slips].prod(axis=1)
+
+    thresholds = norm.ppf(1 - prob[slips]).astype("float32")
+    chol = _cholesky(slip_correlations(props, slips, table, **columns))
+    draws = np.random.default_rng(seed).standard_normal((simulations, slips.shape[1]), dtype="float32")
+
+    hit_rate = np.empty(len(slips))
+    for start in range(0, len(slips), CHUNK_SLIPS):
+        stop = start + CHUNK_SLIPS
+        latent = draws @ np.swapaxes(chol[start:stop], -1, -2)
+        hit_rate[start:stop] = (latent > thresholds[start:stop, None, :]).all(axis=2).mean(axis=1)
+    return hit_rate
+
+
+if __name__ == "__main__":
+    # Imported here so the app can use this module without pulling in nba_api
+    from game_logs import L10_SEASON, read_stored_logs
+
+    logs = read_stored_logs(L10_SEASON)
+    if logs is None:
+        print("⚠️ No stored game logs, skipping correlations (run build_slate.py to fill game_logs.db)")
+        raise SystemExit(0)
+    table = estimate_correlations(logs)
+    table.to_csv(CORRELATIONS_FILE, index=False)
+    print(table.to_string(index=False))
+    print(f"✅ Saved {CORRELATIONS_FILE}")
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+# Type -> (line column, projection column) in the LoL projection sheet. Another stat
+# (e.g. deaths, CS) is one more entry once the sheet has its columns.
+LOL_STATS = {
+    "Kills": ("KILLS", "K PROJ."),
+    "Assists": ("ASSISTS", "A PROJ."),
+}
+
+
+# One row per (player, stat) with a line and a projection, in sheet order:
+# Player, Team, Line, Proj, Type, Diff, TeamOdds, Bet
+def expand_props(sheet):
+    sheet = sheet.rename(columns=lambda c: str(c).strip().upper())
+    frames = []
+    for stat, (line_col, proj_col) in LOL_STATS.items():
+        if line_col not in sheet.columns or proj_col not in sheet.columns:
+            continue
+        frames.append(pd.DataFrame({
+            "Player": sheet["PLAYER"],
+            "Team": sheet["TEAM"],
+            "Line": pd.to_numeric(sheet[line_col], errors="coerce"),
+            "Proj": pd.to_numeric(sheet[proj_col], errors="coerce"),
+            "Type": stat,
+            "TeamOdds": sheet["TEAM ODDS"],
+        }))
+
+    # Stable sort on the sheet row keeps each player's stats together, in LOL_STATS order
+    props = pd.concat(frames).sort_index(kind="stable").dropna(subset=["Line", "Proj"])
+    props["Diff"] = props["Proj"] - props["Line"]
+    props["Bet"] = np.where(props["Diff"] > 0, "Over", "Under")
+    return props[["Player", "Team", "Line", "Proj", "Type", "Diff", "TeamOdds", "Bet"]].reset_index(drop=True)
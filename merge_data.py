@@ -1,41 +1,21 @@
-import pandas as pd
+import sys
 
-# Updated file paths for L10 + H2H data (now includes Opponent)
-l10_h2h_files = {
-    "POINTS": "Player_Points_L10_H2H.csv",
-    "REBOUNDS": "Player_Rebounds_L10_H2H.csv",
-    "ASSISTS": "Player_Assists_L10_H2H.csv"
-}
+from stat_types import load_l10_h2h_long, load_odds_long, write_category_views
 
-# File paths for cleaned best odds
-cleaned_odds_files = {
-    "POINTS": "Cleaned_Best_Odds_POINTS.csv",
-    "REBOUNDS": "Cleaned_Best_Odds_REBOUNDS.csv",
-    "ASSISTS": "Cleaned_Best_Odds_ASSISTS.csv"
-}
+# Every category in one long table keyed on (Player, Category)
+OUTPUT_FILE = "Merged_Betting_Data.csv"
 
-# Output files
-output_files = {
-    "POINTS": "Merged_Betting_Data_POINTS.csv",
-    "REBOUNDS": "Merged_Betting_Data_REBOUNDS.csv",
-    "ASSISTS": "Merged_Betting_Data_ASSISTS.csv"
-}
+# Load L10 + H2H data (includes Opponent) and cleaned odds for all categories at once
+l10_h2h_df = load_l10_h2h_long().set_index(["Player", "Category"])
+odds_df = load_odds_long().set_index(["Player", "Category"])
 
-# Merge each category separately
-for category in ["POINTS", "REBOUNDS", "ASSISTS"]:
-    try:
-        # Load L10 + H2H Data (includes Opponent now)
-        l10_h2h_df = pd.read_csv(l10_h2h_files[category])
+# Single indexed join on (Player, Category)
+merged_df = odds_df.join(l10_h2h_df, how="inner").reset_index()
 
-        # Load Cleaned Odds Data
-        odds_df = pd.read_csv(cleaned_odds_files[category])
+merged_df.to_csv(OUTPUT_FILE, index=False)
+print(f"✅ Merged data saved: {OUTPUT_FILE} ({len(merged_df)} rows)")
 
-        # Merge on Player name
-        merged_df = pd.merge(odds_df, l10_h2h_df, on="Player", how="inner")
-
-        # Save merged data
-        merged_df.to_csv(output_files[category], index=False)
-        print(f"✅ Merged data saved: {output_files[category]}")
-
-    except Exception as e:
-        print(f"❌ Error merging {category}: {e}")
+# --views: also write the old per-category Merged_Betting_Data_<CAT>.csv files
+if "--views" in sys.argv:
+    write_category_views(merged_df, "Merged_Betting_Data")
+    print("✅ Per-category views saved")
@@ -1,52 +1,53 @@
+import os
+import sys
+
 import pandas as pd
 
-# Load datasets
-ai_points = pd.read_csv("AI_Projections_POINTS.csv")
-ai_rebounds = pd.read_csv("AI_Projections_REBOUNDS.csv")
-ai_assists = pd.read_csv("AI_Projections_ASSISTS.csv")
-
-odds_points = pd.read_csv("Cleaned_Best_Odds_POINTS.csv")
-odds_rebounds = pd.read_csv("Cleaned_Best_Odds_REBOUNDS.csv")
-odds_assists = pd.read_csv("Cleaned_Best_Odds_ASSISTS.csv")
-
-# Now includes Opponent clearly:
-l10_h2h_points = pd.read_csv("Player_Points_L10_H2H.csv")
-l10_h2h_rebounds = pd.read_csv("Player_Rebounds_L10_H2H.csv")
-l10_h2h_assists = pd.read_csv("Player_Assists_L10_H2H.csv")
-
-# Function to merge AI Projections, Odds, and L10/H2H Stats
-def merge_data(ai_df, odds_df, l10_h2h_df, category):
-    merged_df = ai_df.merge(odds_df, on="Player", how="left") \
-                     .merge(l10_h2h_df, on="Player", how="left")
-
-    # Rename best odds column
-    merged_df.rename(columns={"Best_Point": "Best_Line"}, inplace=True)
-
-    # ✅ Ensure L10 and H2H values are merged
-    if category == "POINTS":
-        merged_df.rename(columns={"L10_PTS": "L10", "H2H_PTS": "H2H"}, inplace=True)
-    elif category == "REBOUNDS":
-        merged_df.rename(columns={"L10_REB": "L10", "H2H_REB": "H2H"}, inplace=True)
-    elif category == "ASSISTS":
-        merged_df.rename(columns={"L10_AST": "L10", "H2H_AST": "H2H"}, inplace=True)
-
-    # Ensure Edge is calculated properly
-    merged_df["Edge"] = merged_df["AI_Projection"] - merged_df["Best_Line"]
-
-    # Keep the Opponent column (already merged from l10_h2h)
-    final_cols = ["Player", "Opponent", "Best_Line", "AI_Projection", "L10", "H2H",
-                  "Best_Over_Odds", "Best_Under_Odds", "Edge"]
-    
-    # Reorder and keep only necessary columns
-    merged_df = merged_df[final_cols]
-
-    # Save to CSV
-    merged_df.to_csv(f"Final_Projections_{category}.csv", index=False)
-    print(f"✅ Saved Final_Projections_{category}.csv")
-
-# Merge all categories
-merge_data(ai_points, odds_points, l10_h2h_points, "POINTS")
-merge_data(ai_rebounds, odds_rebounds, l10_h2h_rebounds, "REBOUNDS")
-merge_data(ai_assists, odds_assists, l10_h2h_assists, "ASSISTS")
+from build_features import FEATURES_FILE, LAST_COLS
+from odds_history import HISTORY_FILE, prop_movement
+from stat_types import load_l10_h2h_long, load_odds_long, load_projections_long, write_category_views
+
+# Every category in one long table keyed on (Player, Category)
+OUTPUT_FILE = "Final_Projections.csv"
+
+FINAL_COLS = ["Player", "Category", "Opponent", "Best_Line", "AI_Projection", "L10", "H2H",
+              "Best_Over_Odds", "Best_Under_Odds", "Edge"]
+OPTIONAL_COLS = ["Team", "STDDEV", "Books", "Consensus_Over_Prob", "Consensus_Under_Prob",
+                 "L3", "L5", "Hit_Rate_L5", "Hit_Rate_L10", "L3_Hits", "Line_Delta", "Price_Delta"] + LAST_COLS
+
+# Load AI projections, odds and L10/H2H stats, each stacked once across categories
+keys = ["Player", "Category"]
+ai_df = load_projections_long().set_index(keys)
+odds_df = load_odds_long().rename(columns={"Best_Point": "Best_Line"}).set_index(keys)
+l10_h2h_df = load_l10_h2h_long().set_index(keys)
+
+# Merge AI projections with odds and L10/H2H stats in one indexed join
+merged_df = ai_df.join([odds_df, l10_h2h_df], how="left")
+
+# Game-log features (build_features.py), when built; the projection model's STDDEV wins
+if os.path.exists(FEATURES_FILE):
+    features_df = pd.read_csv(FEATURES_FILE).drop(columns=["Line", "L10_Mean"]).set_index(keys)
+    merged_df = merged_df.join(features_df, how="left", rsuffix="_Features")
+    if "STDDEV_Features" in merged_df.columns:
+        merged_df["STDDEV"] = merged_df["STDDEV"].fillna(merged_df.pop("STDDEV_Features"))
+
+# Line and price movement since open, from the odds history clean_odds.py appends to
+if os.path.exists(HISTORY_FILE):
+    merged_df = merged_df.join(prop_movement().set_index(keys), how="left")
+merged_df = merged_df.reset_index()
+
+# Ensure Edge is calculated properly
+merged_df["Edge"] = merged_df["AI_Projection"] - merged_df["Best_Line"]
+
+# Keep the Opponent column (already merged from l10_h2h) and whatever extras upstream produced
+merged_df = merged_df[FINAL_COLS + [c for c in OPTIONAL_COLS if c in merged_df.columns]]
+
+merged_df.to_csv(OUTPUT_FILE, index=False)
+print(f"✅ Saved {OUTPUT_FILE} ({len(merged_df)} rows)")
+
+# --views: also write the old per-category Final_Projections_<CAT>.csv files
+if "--views" in sys.argv:
+    write_category_views(merged_df, "Final_Projections")
+    print("✅ Per-category views saved")
 
 print("✅ Merging completed successfully!")
@@ -0,0 +1,72 @@
+import difflib
+import re
+import unicodedata
+from functools import lru_cache
+
+from nba_api.stats.static import players, teams
+
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+FUZZY_CUTOFF = 0.85
+
+
+# "Luka Dončić" -> "luka doncic", "T.J. McConnell" -> "tj mcconnell",
+# "Jaren Jackson Jr." -> "jaren jackson", "Shai Gilgeous-Alexander" -> "shai gilgeous alexander"
+def normalize_name(name):
+    name = unicodedata.normalize("NFKD", str(name))
+    name = "".join(c for c in name if not unicodedata.combining(c)).casefold()
+    name = re.sub(r"[.'’]", "", name)
+    tokens = re.sub(r"[^a-z0-9]+", " ", name).split()
+    return " ".join(t for t in tokens if t not in NAME_SUFFIXES)
+
+
+# Normalized name -> player id, built once. Active players win name collisions
+# with retired ones.
+@lru_cache(maxsize=None)
+def player_index():
+    all_players = sorted(players.get_players(), key=lambda p: p["is_active"])
+    return {normalize_name(p["full_name"]): p["id"] for p in all_players}
+
+
+@lru_cache(maxsize=None)
+def active_player_keys():
+    return [normalize_name(p["full_name"]) for p in players.get_active_players()]
+
+
+# Team id -> abbreviation, built once
+@lru_cache(maxsize=None)
+def team_index():
+    return {team["id"]: team["abbreviation"] for team in teams.get_teams()}
+
+
+def team_abbreviation(team_id):
+    return team_index().get(team_id)
+
+
+# Exact match on the normalized name, then the closest active player's name
+def player_id(name):
+    key = normalize_name(name)
+    index = player_index()
+    if key in index:
+        return index[key]
+    close = difflib.get_close_matches(key, active_player_keys(), n=1, cutoff=FUZZY_CUTOFF)
+    if close:
+        print(f"🔎 Matched '{name}' to '{close[0]}'")
+        return index[close[0]]
+    return None
+
+
+# Resolve a list of names to {name: id}, reporting every unresolved name at once
+def resolve_players(names):
+    resolved, unresolved = {}, []
+    for name in names:
+        if not name:
+            continue
+        pid = player_id(name)
+        if pid is None:
+            unresolved.append(name)
+        else:
+            resolved[name] = pid
+
+    if unresolved:
+        print(f"❌ No ID found for {len(unresolved)} player(s), skipping: {', '.join(unresolved)}")
+    return resolved
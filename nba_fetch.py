@@ -0,0 +1,126 @@
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from nba_api.stats.endpoints import playergamelogs
+from nba_api.stats.library.http import NBAStatsHTTP
+
+from instrument import read_recent, record
+
+HEADERS = {
+    "Host": "stats.nba.com",
+    "Connection": "keep-alive",
+    "Accept": "application/json",
+    "User-Agent": "Mozilla/5.0",
+    "x-nba-stats-origin": "stats",
+    "x-nba-stats-token": "true",
+    "Referer": "https://www.nba.com/",
+}
+
+# Fetch engine settings: stats.nba.com starts answering 429 well above ~2 requests/second
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 2.0
+BURST = 2
+MAX_RETRIES = 4
+BACKOFF_SECONDS = 2.0
+TIMEOUT_SECONDS = 30
+
+# Point nba_api at a local stand-in for the API, e.g.
+# NBA_STATS_BASE_URL="http://127.0.0.1:8765/stats/{endpoint}" (see stub_stats_server.py)
+if os.environ.get("NBA_STATS_BASE_URL"):
+    NBAStatsHTTP.base_url = os.environ["NBA_STATS_BASE_URL"]
+
+
+# Token bucket shared by every worker thread: `rate` requests/second, bursts up to `burst`
+class TokenBucket:
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+limiter = TokenBucket(REQUESTS_PER_SECOND, BURST)
+
+# Run one API call through the rate limiter, retrying 429s, timeouts and garbled
+# responses with exponential backoff. nba_api does not raise on HTTP errors, so a
+# throttled request surfaces as a JSON decode (ValueError) or missing data set (KeyError).
+# Timings count time spent in requests only, not waiting on the limiter or backoff.
+def call_with_retry(fn, label):
+    elapsed = 0.0
+    for attempt in range(1, MAX_RETRIES + 2):
+        limiter.acquire()
+        start = time.perf_counter()
+        try:
+            result = fn()
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            elapsed += time.perf_counter() - start
+            if attempt > MAX_RETRIES:
+                record(f"request:{label.split()[0]}", elapsed, False, label=label, attempts=attempt)
+                raise
+            delay = BACKOFF_SECONDS * 2 ** (attempt - 1) + random.uniform(0, 0.5)
+            print(f"🔁 {label}: {type(e).__name__}, retrying in {delay:.1f}s ({attempt}/{MAX_RETRIES})")
+            time.sleep(delay)
+            continue
+        record(f"request:{label.split()[0]}", elapsed + time.perf_counter() - start, True, label=label, attempts=attempt)
+        return result
+
+
+# Every player's regular-season game log for a season in a single request,
+# optionally only games on or after date_from (MM/DD/YYYY)
+def fetch_season_logs(season, date_from=""):
+    return call_with_retry(
+        lambda: playergamelogs.PlayerGameLogs(
+            date_from_nullable=date_from,
+            season_nullable=season,
+            season_type_nullable="Regular Season",
+            headers=HEADERS,
+            timeout=TIMEOUT_SECONDS * 4,
+        ).get_data_frames()[0],
+        f"PlayerGameLogs league {season} {date_from}".rstrip(),
+    )
+
+
+# Run fn(item) for every item on a bounded thread pool, preserving input order.
+# Failures are reported and returned as None so one bad player can't sink the slate.
+def run_concurrently(fn, items, max_workers=MAX_WORKERS):
+    def safe(item):
+        try:
+            return fn(item)
+        except Exception as e:
+            print(f"❌ {item}: {type(e).__name__}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(safe, items))
+
+
+# Request count, failures and latency percentiles for the requests this process made
+# (its request:* timings in instrument)
+def timing_summary():
+    requests_made = [t for t in read_recent(path="") if t["section"].startswith("request:")]
+    seconds = sorted(t["seconds"] for t in requests_made)
+    failed = sum(not t["ok"] for t in requests_made)
+    retried = sum(t["attempts"] > 1 for t in requests_made)
+    if not seconds:
+        return "No requests made."
+    p50 = seconds[len(seconds) // 2]
+    p95 = seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))]
+    return (f"{len(seconds)} requests, {failed} failed, {retried} retried | "
+            f"p50 {p50:.2f}s, p95 {p95:.2f}s, max {seconds[-1]:.2f}s")
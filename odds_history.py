@@ -0,0 +1,183 @@
+import os
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+
+# Every odds snapshot ever seen, appended by clean_odds.py and odds_stream.py:
+#   snapshots - (ts, player, stat, book, side, line, price), one row per quote that
+#               changed since the previous snapshot, never updated or deleted
+#   opening   - first (ts, line, price) per (player, stat, book, side) since it was last
+#               closed, i.e. where the quote opened for the current game
+#   latest    - most recent (ts, line, price) per (player, stat, book, side)
+# Movement since open only reads opening and latest, so it doesn't scan the history.
+# A quote pulled from a full snapshot is closed: a snapshot row with no line or price,
+# and it leaves opening and latest. `stat` is the board's Category label ("Points");
+# `book` is the book name. Dumps without a book column can't tell their quotes apart, so
+# they are recorded as one MAIN_QUOTE per side: the main line and its best price, as the
+# board shows them.
+HISTORY_FILE = "odds_history.db"
+QUOTE_KEY = ["player", "stat", "book", "side"]
+MAIN_QUOTE = "main"
+
+
+def connect(path=HISTORY_FILE):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS snapshots (
+            ts TEXT, player TEXT, stat TEXT, book TEXT, side TEXT, line REAL, price REAL
+        )""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_quote ON snapshots (player, stat, book, side, ts)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_ts ON snapshots (ts)")
+    for table in ["opening", "latest"]:
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                player TEXT, stat TEXT, book TEXT, side TEXT, ts TEXT, line REAL, price REAL,
+                PRIMARY KEY (player, stat, book, side)
+            )""")
+    return conn
+
+
+# Append a snapshot of quotes (load_odds columns: label, description, price, point, book)
+# for one stat. Quotes whose line and price match the latest stored ones are skipped, so
+# re-running clean_odds on an unchanged dump adds nothing. With full=True the quotes are
+# the stat's whole board, and stored quotes missing from it are closed. Returns the rows
+# appended.
+def record_odds(odds, stat, ts=None, path=HISTORY_FILE, full=False):
+    ts = ts or datetime.now().isoformat(timespec="milliseconds")
+    quotes = odds.dropna(subset=["price", "point"])
+    if quotes.empty:
+        return 0
+
+    # One quote per book and side: a book's alternate lines after its first are ignored
+    booked = quotes[quotes["book"].notna()].drop_duplicates(["description", "book", "label"])
+    rows = [(ts, player, stat, str(book), side, float(line), float(price))
+            for player, book, side, line, price in zip(booked["description"], booked["book"],
+                                                      booked["label"], booked["point"], booked["price"])]
+    unbooked = quotes[quotes["book"].isna()]
+    if len(unbooked):
+        from clean_odds import best_odds  # clean_odds imports this module
+
+        main = best_odds(unbooked)
+        for side in ["Over", "Under"]:
+            priced = main.dropna(subset=[f"Best_{side}_Odds"])
+            rows += [(ts, player, stat, MAIN_QUOTE, side, float(line), float(price))
+                     for player, line, price in zip(priced["Player"], priced["Best_Point"], priced[f"Best_{side}_Odds"])]
+
+    conn = connect(path)
+    try:
+        stored = {tuple(key): (line, price) for *key, line, price in conn.execute(
+            "SELECT player, stat, book, side, line, price FROM latest WHERE stat = ?", (stat,))}
+        changed = [row for row in rows if stored.get(row[1:5]) != row[5:]]
+        closed = list(stored.keys() - {row[1:5] for row in rows}) if full else []
+        with conn:
+            conn.executemany("INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?)", changed)
+            conn.executemany("INSERT OR IGNORE INTO opening VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             [row[1:5] + row[:1] + row[5:] for row in changed])
+            conn.executemany("INSERT OR REPLACE INTO latest VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             [row[1:5] + row[:1] + row[5:] for row in changed])
+            conn.executemany("INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, NULL, NULL)",
+                             [(ts,) + key for key in closed])
+            for table in ["opening", "latest"]:
+                conn.executemany(f"DELETE FROM {table} WHERE player = ? AND stat = ? AND book = ? AND side = ?", closed)
+    finally:
+        conn.close()
+    return len(changed) + len(closed)
+
+
+def _where(stat, players):
+    clauses, params = [], []
+    if stat is not None:
+        clauses.append("stat = ?")
+        params.append(stat)
+    if players is not None:
+        players = list(players)
+        clauses.append(f"player IN ({', '.join('?' for _ in players)})")
+        params += players
+    return clauses, params
+
+
+# The last quote at or before `before` per (player, stat, book, side), i.e. the closing
+# line when `before` is tip-off; the latest quotes when it's None. Quotes closed by then
+# are left out.
+def closing_lines(before=None, stat=None, players=None, path=HISTORY_FILE):
+    clauses, params = _where(stat, players)
+    if before is None:
+        query = "SELECT * FROM latest"
+    else:
+        clauses.append("ts <= ?")
+        params.append(before)
+        query = f"""
+            SELECT s.player, s.stat, s.book, s.side, s.ts, s.line, s.price
+            FROM snapshots s JOIN (
+                SELECT player, stat, book, side, MAX(ts) AS ts FROM snapshots
+                WHERE {' AND '.join(clauses)} GROUP BY player, stat, book, side
+            ) last USING (player, stat, book, side, ts)
+            WHERE s.line IS NOT NULL"""
+        clauses = []
+    if clauses:
+        query += f" WHERE {' AND '.join(clauses)}"
+    conn = connect(path)
+    try:
+        return pd.read_sql_query(query, conn, params=params)
+    finally:
+        conn.close()
+
+
+# The last quote of each day per (player, stat, book, side), with its date (YYYY-MM-DD);
+# quotes closed at the end of the day are left out
+def daily_closing_lines(stat=None, path=HISTORY_FILE):
+    clauses, params = _where(stat, None)
+    conn = connect(path)
+    try:
+        return pd.read_sql_query(f"""
+            SELECT s.player, s.stat, s.book, s.side, last.date, s.ts, s.line, s.price
+            FROM snapshots s JOIN (
+                SELECT player, stat, book, side, substr(ts, 1, 10) AS date, MAX(ts) AS ts FROM snapshots
+                {f"WHERE {' AND '.join(clauses)}" if clauses else ""}
+                GROUP BY player, stat, book, side, date
+            ) last USING (player, stat, book, side, ts)
+            WHERE s.line IS NOT NULL""", conn, params=params)
+    finally:
+        conn.close()
+
+
+# Per quote: where it opened (or stood at `since`), where it is now, and the change in
+# line and price. Empty when there is no history yet.
+def movement(since=None, stat=None, players=None, path=HISTORY_FILE):
+    columns = QUOTE_KEY + ["Open_Line", "Open_Price", "Line", "Price", "Line_Delta", "Price_Delta"]
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=columns)
+    if since is None:
+        clauses, params = _where(stat, players)
+        conn = connect(path)
+        try:
+            start = pd.read_sql_query(
+                "SELECT * FROM opening" + (f" WHERE {' AND '.join(clauses)}" if clauses else ""), conn, params=params)
+        finally:
+            conn.close()
+    else:
+        start = closing_lines(since, stat, players, path)
+    now = closing_lines(None, stat, players, path)
+
+    moves = start.merge(now, on=QUOTE_KEY, suffixes=("_open", ""))
+    moves = moves.rename(columns={"line_open": "Open_Line", "price_open": "Open_Price",
+                                  "line": "Line", "price": "Price"})
+    moves["Line_Delta"] = moves["Line"] - moves["Open_Line"]
+    moves["Price_Delta"] = moves["Price"] - moves["Open_Price"]
+    return moves[columns]
+
+
+# Board columns per (Player, Category), averaged over the books quoting the Over:
+#   Line_Delta  - line change since open (positive: the line went up)
+#   Price_Delta - change in the Over's implied probability since open, in % points
+#                 (positive: the Over got more expensive, i.e. money came in on it)
+def prop_movement(stat=None, players=None, path=HISTORY_FILE):
+    from clean_odds import implied_probability  # clean_odds imports this module
+
+    moves = movement(None, stat, players, path)
+    overs = moves[moves["side"] == "Over"]
+    overs = overs.assign(Price_Delta=(implied_probability(overs["Price"])
+                                      - implied_probability(overs["Open_Price"])) * 100)
+    props = overs.groupby(["player", "stat"], sort=False)[["Line_Delta", "Price_Delta"]].mean().round(2)
+    return props.reset_index().rename(columns={"player": "Player", "stat": "Category"})
@@ -0,0 +1,248 @@
+# Intraday odds: apply a stream of price/line updates to the scored board and republish it.
+#
+#   python odds_stream.py --follow odds_updates.jsonl     # tail a file the feed appends to
+#   python odds_stream.py --socket 127.0.0.1:9009         # or accept lines over TCP
+#
+# One JSON update per line, e.g.
+#   {"category": "POINTS", "player": "Aaron Nesmith", "book": "dk", "side": "Over", "line": 10.5, "price": -115}
+# Every update is appended to the odds history. Only the affected (player, category) rows
+# are re-scored; the board is republished to Scored_Board.parquet (atomically, at most
+# every DEBOUNCE_SECONDS) and the app picks it up on its next rerun. When the pipeline
+# republishes the board (new projections, features), the stream takes it as its new base
+# and re-applies the streamed odds on top.
+import argparse
+import json
+import os
+import queue
+import socketserver
+import threading
+import time
+
+import pandas as pd
+
+from clean_odds import best_odds, load_odds
+from data_loader import SCORED_BOARD_FILE, file_signature, load_board, publish_board
+from instrument import record
+from odds_history import HISTORY_FILE, prop_movement, record_odds
+from scoring import score_board
+from stat_types import STAT_TYPES
+
+DEBOUNCE_SECONDS = 0.25
+POLL_SECONDS = 0.05
+SIDES = {"over": "Over", "under": "Under"}
+
+# Category key or label ("POINTS" / "Points") -> board label
+CATEGORY_LABELS = {**{k: s["label"] for k, s in STAT_TYPES.items()},
+                   **{s["label"]: s["label"] for s in STAT_TYPES.values()}}
+
+
+# Every quote per (player, category), keyed (quote, side) -> (line, price, book), and the
+# scored board they feed. A quote is one book's current price on one side, so an update
+# that moves a book's line replaces its old line instead of adding a second one. Quotes
+# keep their first-seen order so best_odds breaks ties the same way clean_odds.py does.
+class OddsBook:
+    def __init__(self, board):
+        self.quotes = {}
+        self.changes = []  # Applied updates not yet in the odds history
+        self.streamed = set()  # Props with applied updates, re-scored when the base board changes
+        self.set_board(board)
+
+    # Use a new base board (e.g. one the pipeline republished); the quotes are kept
+    def set_board(self, board):
+        self.board = board.reset_index(drop=True)
+        for col in self.board.select_dtypes("category").columns:
+            self.board[col] = self.board[col].astype(object)
+        self.rows = {key: i for i, key in enumerate(zip(self.board["Player"], self.board["Category"]))}
+
+    # Start from the full dumps clean_odds.py reads. Their quote ids are the book name, or
+    # the quote's position in dumps without a book column; only a book's first line per
+    # side is kept, like the odds history does.
+    def seed(self, path_for=lambda category: f"NBA STATS - {category}.csv"):
+        for category, stat in STAT_TYPES.items():
+            path = path_for(category)
+            if not os.path.exists(path):
+                continue
+            odds = load_odds(path).dropna(subset=["price", "point"])
+            for row in odds.itertuples(index=False):
+                book = row.book if isinstance(row.book, str) else None
+                self.quotes.setdefault((row.description, stat["label"]), {}).setdefault(
+                    (row.quote, row.label), (row.point, row.price, book))
+
+    # Apply one update; returns the (player, category) it touched, or None if it's unusable
+    def apply(self, update):
+        category = CATEGORY_LABELS.get(str(update.get("category", "")).strip())
+        side = SIDES.get(str(update.get("side", "")).strip().lower())
+        player = str(update.get("player", "")).strip()
+        try:
+            line, price = float(update["line"]), float(update["price"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if category is None or side is None or not player:
+            return None
+        book = str(update.get("book") or "feed")
+        self.quotes.setdefault((player, category), {})[(book, side)] = (line, price, book)
+        self.changes.append({"label": side, "description": player, "price": price, "point": line,
+                             "book": book, "Category": category})
+        self.streamed.add((player, category))
+        return player, category
+
+    # Append the applied updates to the odds history
+    def save_history(self):
+        if not self.changes:
+            return
+        changes, self.changes = pd.DataFrame(self.changes), []
+        # A quote updated twice in one batch: only its last price is current
+        changes = changes.drop_duplicates(["description", "book", "label", "Category"], keep="last")
+        for category, quotes in changes.groupby("Category", sort=False):
+            record_odds(quotes, category)
+
+    # Best odds on the main line for the touched props, then score_board on just their rows
+    def rescore(self, keys):
+        keys = [key for key in keys if key in self.rows and key in self.quotes]
+        if not keys:
+            return 0
+        frames = []
+        for player, category in keys:
+            quotes = self.quotes[(player, category)]
+            frames.append(pd.DataFrame({
+                "label": [side for _, side in quotes],
+                "description": player,
+                "price": [price for _, price, _ in quotes.values()],
+                "point": [line for line, _, _ in quotes.values()],
+                "book": [book for _, _, book in quotes.values()],
+                "quote": [quote for quote, _ in quotes],
+                "Category": category,
+            }))
+        odds = pd.concat(frames, ignore_index=True)
+        best = pd.concat([best_odds(group).assign(Category=category)
+                          for category, group in odds.groupby("Category", sort=False)])
+        best = best.rename(columns={"Best_Point": "Best_Line"}).set_index(["Player", "Category"])
+
+        index = [self.rows[key] for key in best.index]
+        rows = self.board.loc[index].copy()
+        for col in best.columns.intersection(rows.columns):  # Only what the pipeline merged in
+            rows[col] = best[col].to_numpy()
+        rows["Edge"] = rows["AI_Projection"] - rows["Best_Line"]
+        if "Line_Delta" in rows.columns and os.path.exists(HISTORY_FILE):
+            moves = prop_movement(players={player for player, _ in keys}).set_index(["Player", "Category"])
+            moves = moves.reindex(best.index)
+            rows["Line_Delta"] = moves["Line_Delta"].to_numpy()
+            rows["Price_Delta"] = moves["Price_Delta"].to_numpy()
+        rescored = score_board(rows).set_axis(index)
+        # Swap the rows in whole, so columns whose dtype changes (e.g. all-None notes) still fit
+        self.board = pd.concat([self.board.drop(index), rescored]).sort_index()[self.board.columns]
+        return len(index)
+
+
+# Lines appended to a file, like `tail -f` (starting at its end unless from_start)
+def follow_file(path, updates, from_start=False):
+    while not os.path.exists(path):
+        time.sleep(POLL_SECONDS)
+    with open(path) as f:
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        pending = ""
+        while True:
+            chunk = f.readline()
+            if not chunk:
+                time.sleep(POLL_SECONDS)
+                continue
+            pending += chunk
+            if pending.endswith("\n"):
+                updates.put((time.perf_counter(), pending))
+                pending = ""
+
+
+# Lines sent by any number of TCP clients (a local stand-in for a push feed)
+def serve_socket(host, port, updates):
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                updates.put((time.perf_counter(), raw.decode("utf-8", errors="replace")))
+
+    server = socketserver.ThreadingTCPServer((host, port), Handler)
+    server.daemon_threads = True
+    print(f"📡 Listening for odds updates on {host}:{port}")
+    server.serve_forever()
+
+
+def parse_update(line):
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        update = json.loads(line)
+    except ValueError:
+        print(f"⚠️ Skipping malformed update: {line[:80]}")
+        return None
+    return update if isinstance(update, dict) else None
+
+
+# Everything queued right now, waiting up to `timeout` for the first update
+def drain(updates, timeout):
+    batch = []
+    try:
+        batch.append(updates.get(timeout=timeout))
+        while True:
+            batch.append(updates.get_nowait())
+    except queue.Empty:
+        pass
+    return batch
+
+
+# Apply updates as they arrive, re-score the touched props and publish at most once per
+# debounce window
+def run(book, updates, output=SCORED_BOARD_FILE):
+    dirty, oldest, last_publish = set(), None, 0.0
+    published = file_signature([output])  # The board as this stream last saw or wrote it
+    while True:
+        for received, line in drain(updates, DEBOUNCE_SECONDS):
+            update = parse_update(line)
+            key = book.apply(update) if update else None
+            if key is not None:
+                dirty.add(key)
+                oldest = received if oldest is None else min(oldest, received)
+
+        # Someone else (run_pipeline.py) republished the board: build on theirs, not ours
+        current = file_signature([output])
+        if current != published and os.path.exists(output):
+            book.set_board(pd.read_parquet(output))
+            published = current
+            dirty |= book.streamed
+            oldest = oldest or time.perf_counter()
+            print(f"🔁 {output} was republished, re-applying {len(book.streamed)} streamed prop(s)")
+
+        if dirty and time.perf_counter() - last_publish >= DEBOUNCE_SECONDS:
+            start = time.perf_counter()
+            book.save_history()
+            rescored = book.rescore(dirty)
+            publish_board(book.board, output)
+            published = file_signature([output])
+            last_publish = time.perf_counter()
+            latency = last_publish - oldest
+            record("stream:publish", latency, True, props=rescored, rescore_seconds=round(last_publish - start, 4))
+            print(f"✅ Re-scored {rescored} prop(s), published in {latency * 1000:.0f} ms")
+            dirty, oldest = set(), None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream odds updates into the scored board")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--follow", help="File of JSON updates to tail")
+    source.add_argument("--socket", help="HOST:PORT to accept JSON updates on")
+    parser.add_argument("--from-start", action="store_true", help="Replay the followed file from its start")
+    args = parser.parse_args()
+
+    book = OddsBook(load_board())
+    book.seed()
+    print(f"📥 {len(book.rows)} props on the board, quotes for {len(book.quotes)}")
+
+    updates = queue.Queue()
+    if args.follow:
+        target, target_args = follow_file, (args.follow, updates, args.from_start)
+    else:
+        host, port = args.socket.rsplit(":", 1)
+        target, target_args = serve_socket, (host, int(port), updates)
+    threading.Thread(target=target, args=target_args, daemon=True).start()
+
+    run(book, updates)
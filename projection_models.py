@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+from game_logs import long_logs
+
+DEFENSE_FILE = "defensive_ratings.csv"
+EWM_HALFLIFE = 5  # games
+L10_WEIGHT = 0.6  # blend: share of L10, the rest is H2H
+
+# Registered projection models. Each takes the long player table (Player, Category,
+# Opponent, L10, H2H and PLAYER_ID when game logs are available) plus the current season's
+# game logs (or None) and returns AI_Projection and STDDEV aligned to the players' index.
+MODELS = {}
+
+
+def register(name):
+    def wrap(model):
+        MODELS[name] = model
+        return model
+    return wrap
+
+
+def run_model(name, players, logs=None):
+    if name not in MODELS:
+        raise ValueError(f"Unknown projection model '{name}', choose from: {', '.join(MODELS)}")
+    return MODELS[name](players, logs)
+
+
+# Look up a (PLAYER_ID, Category)-indexed series for every player row (NaN without logs)
+def per_player(players, values):
+    if values is None or "PLAYER_ID" not in players.columns:
+        return pd.Series(np.nan, index=players.index)
+    keys = pd.MultiIndex.from_arrays([players["PLAYER_ID"], players["Category"]])
+    return pd.Series(values.reindex(keys).to_numpy(), index=players.index)
+
+
+# Standard deviation of each player's last n games per stat
+def recent_stddev(logs, n=10):
+    if logs is None:
+        return None
+    recent = long_logs(logs).groupby(["PLAYER_ID", "Category"]).tail(n)
+    return recent.groupby(["PLAYER_ID", "Category"])["Value"].std()
+
+
+# l10_weight * L10 + the rest H2H; L10 alone when the player hasn't faced the opponent
+def blend_projection(l10, h2h, l10_weight=L10_WEIGHT):
+    return (l10 * l10_weight + h2h * (1 - l10_weight)).fillna(l10)
+
+
+# 60% L10 + 40% H2H
+@register("blend")
+def blend(players, logs=None):
+    return pd.DataFrame({
+        "AI_Projection": blend_projection(players["L10"], players["H2H"]),
+        "STDDEV": per_player(players, recent_stddev(logs)),
+    })
+
+
+# Blend scaled by the opponent's defense: top-5 defenses x0.9, bottom-6 x1.1
+@register("defense_blend")
+def defense_blend(players, logs=None):
+    result = blend(players, logs)
+    ranks = pd.read_csv(DEFENSE_FILE).set_index("TEAM")["DEF RTG RANK"]
+    rank = players["Opponent"].map(ranks)
+    result["AI_Projection"] *= np.select([rank <= 5, rank >= 25], [0.9, 1.1], default=1.0)
+    return result
+
+
+# Exponentially weighted mean and spread of the season's game logs (half-life 5 games)
+@register("ewm")
+def ewm(players, logs=None):
+    if logs is None:
+        raise ValueError("The ewm model needs game logs: run build_slate.py to fill game_logs.db")
+    games = long_logs(logs)
+    weighted = games.groupby(["PLAYER_ID", "Category"])["Value"].ewm(halflife=EWM_HALFLIFE)
+    mean = weighted.mean().groupby(level=[0, 1]).last()
+    std = weighted.std().groupby(level=[0, 1]).last()
+    return pd.DataFrame({
+        "AI_Projection": per_player(players, mean),
+        "STDDEV": per_player(players, std),
+    })
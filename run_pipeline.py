@@ -0,0 +1,214 @@
+# Pipeline runner: runs each stage script only when its inputs changed, independent
+# stages in parallel.
+#
+#   python run_pipeline.py            # rebuild whatever is stale
+#   python run_pipeline.py --fetch    # also re-run the network stages (slate, defense)
+#   python run_pipeline.py --force    # re-run everything
+#   python run_pipeline.py --dry-run  # show what would run
+#   python run_pipeline.py --profile  # cProfile each stage into profiles/
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+
+from instrument import PROFILE, PROFILE_DIR, record
+from stat_types import STAT_TYPES, l10_h2h_file
+
+STATE_FILE = ".pipeline_state.json"
+CATEGORIES = list(STAT_TYPES)
+L10_H2H_FILES = [l10_h2h_file(c) for c in CATEGORIES]
+
+# name -> script, input files, output files, code it imports, and whether it pulls from
+# the network (those only run with --fetch or when an output is missing)
+STAGES = {
+    "slate": {
+        "script": "l10_h2h_today.py",
+        "inputs": ["players.txt"],
+        "outputs": L10_H2H_FILES + ["game_logs.db"],
+        "code": ["build_slate.py", "game_logs.py", "name_index.py", "nba_fetch.py", "stat_types.py"],
+        "network": True,
+    },
+    "defense": {
+        "script": "scrape_defense.py",
+        "inputs": [],
+        "outputs": ["defensive_ratings.csv"],
+        "network": True,
+    },
+    "clean_odds": {
+        "script": "clean_odds.py",
+        "inputs": [f"NBA STATS - {c}.csv" for c in CATEGORIES],
+        "outputs": [f"Cleaned_Best_Odds_{c}.csv" for c in CATEGORIES] + [f"Cleaned_Odds_Lines_{c}.csv" for c in CATEGORIES] + ["odds_history.db"],
+        "code": ["odds_history.py", "stat_types.py"],
+    },
+    "merge": {
+        "script": "merge_data.py",
+        "inputs": L10_H2H_FILES + [f"Cleaned_Best_Odds_{c}.csv" for c in CATEGORIES],
+        "outputs": ["Merged_Betting_Data.csv"],
+        "code": ["stat_types.py"],
+    },
+    "features": {
+        "script": "build_features.py",
+        "inputs": ["game_logs.db"] + L10_H2H_FILES + [f"Cleaned_Best_Odds_{c}.csv" for c in CATEGORIES],
+        "outputs": ["Player_Features.csv"],
+        "code": ["game_logs.py", "name_index.py", "stat_types.py"],
+    },
+    "correlations": {
+        "script": "joint_probability.py",
+        "inputs": ["game_logs.db"],
+        "outputs": ["Leg_Correlations.csv"],
+        "code": ["game_logs.py", "stat_types.py"],
+    },
+    "projections": {
+        "script": "generate_ai_projections.py",
+        "inputs": L10_H2H_FILES + ["game_logs.db"],
+        "outputs": [f"AI_Projections_{c}.csv" for c in CATEGORIES],
+        "code": ["projection_models.py", "game_logs.py", "name_index.py", "stat_types.py"],
+    },
+    "merge_final": {
+        "script": "merge_final_data.py",
+        "inputs": [f"AI_Projections_{c}.csv" for c in CATEGORIES] + [f"Cleaned_Best_Odds_{c}.csv" for c in CATEGORIES] + L10_H2H_FILES + ["Player_Features.csv", "odds_history.db"],
+        "outputs": ["Final_Projections.csv"],
+        "code": ["build_features.py", "odds_history.py", "stat_types.py"],
+    },
+    "scored_board": {
+        "script": "build_scored_board.py",
+        "inputs": ["Final_Projections.csv", "defensive_ratings.csv"],
+        "outputs": ["Scored_Board.parquet"],
+        "code": ["data_loader.py", "scoring.py"],
+    },
+}
+
+
+# Upstream stages: the ones producing any of this stage's inputs
+def dependencies(name):
+    inputs = set(STAGES[name]["inputs"])
+    return {other for other, stage in STAGES.items() if other != name and inputs & set(stage["outputs"])}
+
+
+# Hash of the stage's script, the code it imports and the contents of its inputs
+def stage_hash(name):
+    stage = STAGES[name]
+    digest = hashlib.sha256()
+    for path in [stage["script"]] + stage.get("code", []) + stage["inputs"]:
+        digest.update(path.encode())
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        else:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def load_state():
+    if os.path.exists(STATE_FILE):
+        with open(STATE_FILE) as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state):
+    with open(STATE_FILE, "w") as f:
+        json.dump(state, f, indent=2)
+
+
+# Why a stage has to run, or None when it is up to date
+def stale_reason(name, state, fetch, force):
+    stage = STAGES[name]
+    if force:
+        return "forced"
+    if any(not os.path.exists(path) for path in stage["outputs"]):
+        return "missing output"
+    if stage.get("network"):
+        return "fetch" if fetch else None
+    if state.get(name, {}).get("hash") != stage_hash(name):
+        return "inputs changed"
+    return None
+
+
+# Run a stage's script; with profile, under cProfile into profiles/stage-<name>-<time>.prof
+def run_stage(name, profile=False):
+    command = [sys.executable, STAGES[name]["script"]]
+    if profile:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        output = os.path.join(PROFILE_DIR, f"stage-{name}-{datetime.now():%Y%m%d-%H%M%S}.prof")
+        command[1:1] = ["-m", "cProfile", "-o", output]
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    record(f"stage:{name}", seconds, result.returncode == 0)
+    return result, seconds
+
+
+def run_pipeline(fetch=False, force=False, dry_run=False, max_workers=4, profile=PROFILE):
+    state = load_state()
+    pending = set(STAGES)
+    done, failed, timings = set(), set(), {}
+    would_run = set()  # Dry run: stages that would have run, so their outputs would change
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            # Start every stage whose upstream stages have finished
+            for name in sorted(pending):
+                deps = dependencies(name)
+                if deps & failed:
+                    print(f"⏭️ {name}: skipped, upstream failed")
+                    pending.discard(name)
+                    failed.add(name)
+                elif deps <= done:
+                    pending.discard(name)
+                    reason = stale_reason(name, state, fetch, force)
+                    if reason is None and deps & would_run:
+                        reason = "upstream"
+                    if reason is None:
+                        print(f"✔️ {name}: up to date")
+                        done.add(name)
+                    elif dry_run:
+                        print(f"🔍 {name}: would run ({reason})")
+                        would_run.add(name)
+                        done.add(name)
+                    else:
+                        print(f"🚀 {name}: running ({reason})")
+                        running[pool.submit(run_stage, name, profile)] = name
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                result, seconds = future.result()
+                timings[name] = seconds
+                if result.returncode != 0:
+                    print(f"❌ {name}: failed after {seconds:.1f}s\n{result.stderr.strip()}")
+                    failed.add(name)
+                    continue
+                print(f"✅ {name}: {seconds:.1f}s")
+                state[name] = {
+                    "hash": stage_hash(name),
+                    "seconds": round(seconds, 3),
+                    "ran_at": datetime.now().isoformat(timespec="seconds"),
+                }
+                save_state(state)
+                done.add(name)
+
+    if timings:
+        print("⏱️ " + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in timings.items()))
+    return not failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the stale pipeline stages")
+    parser.add_argument("--fetch", action="store_true", help="Re-run the network stages (slate, defense)")
+    parser.add_argument("--force", action="store_true", help="Re-run every stage")
+    parser.add_argument("--dry-run", action="store_true", help="Only show what would run")
+    parser.add_argument("--profile", action="store_true", help="cProfile each stage into profiles/")
+    args = parser.parse_args()
+
+    sys.exit(0 if run_pipeline(args.fetch, args.force, args.dry_run, profile=args.profile or PROFILE) else 1)
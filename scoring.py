@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+DEFAULT_STDDEV = 4.0
+MAX_BET_ODDS = -110  # Only bet a side priced at -110 or shorter
+MIN_VALUE_PROB = 35
+
+# NBA Value page picks (best_props): category -> (minimum line, maximum Over odds,
+# opponent defense rank above which it may pick)
+VALUE_RULES = {
+    "Points": (17.5, -110, 1),
+    "Rebounds": (4.0, -140, 1),
+    "Assists": (4.0, -135, 1),
+}
+
+
+# Numeric column as a float64 array (NaN when the column is missing)
+def _col(df, name, default=np.nan):
+    if name in df.columns:
+        return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return np.full(len(df), default, dtype="float64")
+
+
+# Score every prop on the board in one pass. Adds:
+#   Bet, Best_Odds            - side and price (get_best_bet)
+#   Prob_Over, Prob_Under     - normal-model probabilities in % (calculate_probability)
+#   AI_Prob                   - probability of the chosen side
+#   Confidence                - 10-100 (calculate_confidence)
+#   Matchup_Tier, Matchup     - defense tier and note (matchup_note)
+#   Tough_Matchup             - opponent is a top-5 defense
+#   Adj_Projection            - defense / L5 adjusted projection (adjusted_projection)
+#   Odds_Score, Value_Score   - payout-weighted edge used to rank picks
+#   Valid_Value               - bettable side with AI_Prob >= 35 (is_valid_value_pick)
+#   Cold_Streak               - 1 or fewer hits in the last 3 games (Last_1..Last_3)
+# max_bet_odds and min_value_prob override the thresholds (e.g. for backtest sweeps).
+def score_board(df, max_bet_odds=MAX_BET_ODDS, min_value_prob=MIN_VALUE_PROB):
+    df = df.copy()
+
+    edge = _col(df, "Edge")
+    over_odds = _col(df, "Best_Over_Odds")
+    under_odds = _col(df, "Best_Under_Odds")
+    line = _col(df, "Best_Line")
+    projection = _col(df, "AI_Projection")
+    l10 = _col(df, "L10")
+    rank = _col(df, "DEF RTG RANK")
+
+    # Bet side and odds
+    is_over = (edge > 0) & (over_odds <= max_bet_odds)
+    is_under = ~is_over & (edge < 0) & (under_odds <= max_bet_odds)
+    bet = np.select([is_over, is_under], ["Over", "Under"], default="Fade")
+    best_odds = np.where(is_over, over_odds, np.where(is_under, under_odds, np.nan))
+
+    # Over/under probability from a single vectorized CDF call
+    std_dev = _col(df, "STDDEV", DEFAULT_STDDEV)
+    std_dev = np.where(np.isnan(std_dev) | (std_dev <= 0), DEFAULT_STDDEV, std_dev)  # 0: identical games
+    cdf = norm.cdf((projection - line) / std_dev)
+    prob_over = np.round((1 - cdf) * 100)
+    prob_under = np.round(cdf * 100)
+    ai_prob = np.where(is_over, prob_over, prob_under)
+
+    # Confidence
+    with np.errstate(divide="ignore", invalid="ignore"):
+        l10_score = np.clip((l10 - line) / line, 0, 1)
+    edge_score = np.clip(np.abs(edge), 0, 1)
+    odds_score = np.select([best_odds >= -115, best_odds >= -130], [1.0, 0.5], default=0.3)
+    defense_penalty = np.where(rank <= 10, 0.2, 0.0)
+    confidence = (edge_score * 0.4 + l10_score * 0.4 + odds_score * 0.2) * (1 - defense_penalty)
+    confidence = np.floor(np.clip(confidence * 100, 10, 100))
+
+    # Matchup tier and note
+    opponent = df["Opponent"] if "Opponent" in df.columns else pd.Series(np.nan, index=df.index)
+    has_matchup = ~np.isnan(rank) & opponent.notna().to_numpy()
+    tier = np.select([~has_matchup, rank >= 20, rank <= 10], ["Unavailable", "Great", "Tough"], default="Neutral")
+    rank_label = pd.Series(np.where(has_matchup, rank, 0), index=df.index).astype(int).astype(str)
+    matchup = pd.Series(tier, index=df.index) + " matchup (" + opponent.astype(str) + " #" + rank_label + ")"
+    matchup = matchup.where(has_matchup, "Matchup data unavailable")
+
+    # Adjusted projection: defense multiplier, overridden by the L5/L10 blend when L5 exists
+    adjusted = projection * np.select([rank <= 5, rank >= 25], [0.9, 1.1], default=1.0)
+    l5 = _col(df, "L5")
+    adjusted = np.where(np.isnan(l5), adjusted, l5 * 0.6 + l10 * 0.4)
+
+    # Value score: edge plus the payout of the chosen side (convert_odds, 0 for Fade)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payout = np.where(best_odds < 0, -100 / best_odds, best_odds / 100)
+    payout = np.where(np.isnan(best_odds), 0.0, payout)
+
+    # Cold streak from the last three games (Last_1..Last_3), when the board has all three
+    last3 = np.column_stack([_col(df, f"Last_{i}") for i in range(1, 4)])
+    cold_streak = ~np.isnan(last3).any(axis=1) & ((last3 >= line[:, None]).sum(axis=1) <= 1)
+
+    df["Bet"] = bet
+    df["Best_Odds"] = best_odds
+    df["Prob_Over"] = prob_over
+    df["Prob_Under"] = prob_under
+    df["AI_Prob"] = ai_prob
+    df["Confidence"] = pd.array(np.where(np.isnan(confidence), np.nan, confidence), dtype="Float64").astype("Int64")
+    df["Matchup_Tier"] = tier
+    df["Matchup"] = matchup.to_numpy()
+    df["Tough_Matchup"] = rank <= 5
+    df["Adj_Projection"] = adjusted
+    df["Odds_Score"] = payout
+    df["Value_Score"] = edge + payout / 75
+    df["Valid_Value"] = (bet != "Fade") & (ai_prob >= min_value_prob)
+    df["Cold_Streak"] = cold_streak
+    return df
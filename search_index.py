@@ -0,0 +1,82 @@
+import difflib
+from collections import defaultdict
+
+from name_index import normalize_name
+
+NGRAM_SIZES = (1, 2, 3)  # Queries up to 3 characters are an n-gram themselves
+FUZZY_CUTOFF = 0.7
+
+
+# Player name search built once per board:
+#   names      - display names in board order, normalized alongside ("Luka Dončić" -> "luka doncic")
+#   prefixes   - every prefix of the full name and of each word -> name ids
+#   ngrams     - every 1-3 character slice of the normalized name -> name ids
+#   rows       - display name -> {category: row offset into the board}
+# Lookups touch only the postings of the query's prefix and n-grams, so they don't scan
+# the board; a board holding several sports (NBA, CS2, LoL) just has more names.
+class SearchIndex:
+    def __init__(self, board, name_col="Player", group_col="Category"):
+        self.names = []
+        self.normalized = []
+        self.prefixes = defaultdict(set)
+        self.ngrams = defaultdict(set)
+        self.rows = defaultdict(dict)
+
+        ids = {}
+        for offset, (name, group) in enumerate(zip(board[name_col], board[group_col])):
+            if name not in ids:
+                ids[name] = self._add(name)
+            self.rows[name].setdefault(group, offset)
+
+    def _add(self, name):
+        name_id = len(self.names)
+        key = normalize_name(name)
+        self.names.append(name)
+        self.normalized.append(key)
+        for word in [key] + key.split():
+            for end in range(1, len(word) + 1):
+                self.prefixes[word[:end]].add(name_id)
+        for size in NGRAM_SIZES:
+            for start in range(len(key) - size + 1):
+                self.ngrams[key[start:start + size]].add(name_id)
+        return name_id
+
+    # Names containing the query: postings of a short query, or the intersection of a
+    # longer query's trigrams checked for the full substring
+    def _containing(self, query):
+        if len(query) <= max(NGRAM_SIZES):
+            return self.ngrams.get(query, set())
+        grams = [query[i:i + 3] for i in range(len(query) - 2)]
+        candidates = set.intersection(*(self.ngrams.get(gram, set()) for gram in grams))
+        return {i for i in candidates if query in self.normalized[i]}
+
+    # Names sharing trigrams with the query that are close to it, best first
+    def _close(self, query):
+        candidates = set()
+        for i in range(len(query) - 2):
+            candidates |= self.ngrams.get(query[i:i + 3], set())
+        scored = []
+        for name_id in candidates:
+            key = self.normalized[name_id]
+            score = max(difflib.SequenceMatcher(None, query, part).ratio()
+                        for part in [key] + key.split())
+            if score >= FUZZY_CUTOFF:
+                scored.append((-score, self.names[name_id]))
+        return [name for _, name in sorted(scored)]
+
+    # Accent- and case-insensitive search: names starting with the query (whole name or
+    # any word) first, then names containing it; close misspellings when nothing matches
+    def search(self, query, limit=None):
+        query = normalize_name(query)
+        if not query:
+            return []
+        starts = self.prefixes.get(query, set())
+        contains = self._containing(query) - starts
+        results = sorted(self.names[i] for i in starts) + sorted(self.names[i] for i in contains)
+        if not results and len(query) >= 3:
+            results = self._close(query)
+        return results[:limit]
+
+    # {category: row offset} for a display name
+    def player_rows(self, name):
+        return self.rows.get(name, {})
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+TOP_K = 3  # Slips per page
+BEAM_WIDTH = 256  # Partial slips kept per leg
+
+
+# American odds -> decimal payout per unit staked (-110 -> 1.909, +150 -> 2.5)
+def decimal_odds(odds):
+    odds = np.asarray(odds, dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(odds < 0, 1 - 100 / odds, 1 + odds / 100)
+
+
+# Integer codes for a column; missing values get their own code each so they never clash
+def _codes(values):
+    codes = pd.factorize(values)[0]
+    missing = codes < 0
+    codes[missing] = -1 - np.arange(missing.sum())
+    return codes
+
+
+# Up to beam_width highest-scoring sets of `legs` props (rows of positions into the
+# arrays, best first) with no repeated player and no shared opponent, or None. Props must
+# be sorted best leg first: the search only extends a slip with later props, so each
+# combination is seen once, and keeps the beam_width best partial slips after every leg.
+def _beam_search(leg_score, player, opponent, legs, beam_width):
+    n = len(leg_score)
+    beams = np.arange(min(n, beam_width))[:, None]
+    scores = leg_score[:len(beams)]
+
+    for _ in range(legs - 1):
+        candidates = scores[:, None] + leg_score[None, :]
+        valid = np.arange(n)[None, :] > beams[:, -1:]
+        valid &= ~(player[beams][:, :, None] == player[None, None, :]).any(axis=1)
+        valid &= ~(opponent[beams][:, :, None] == opponent[None, None, :]).any(axis=1)
+        candidates = np.where(valid, candidates, -np.inf).ravel()
+
+        k = min(beam_width, int(np.isfinite(candidates).sum()))
+        if k == 0:
+            return None
+        top = np.argpartition(-candidates, k - 1)[:k]
+        top = top[np.lexsort((top, -candidates[top]))]  # score, then position: deterministic
+        beam, prop = np.divmod(top, n)
+        beams = np.column_stack([beams[beam], prop])
+        scores = candidates[top]
+
+    return beams if len(beams) else None
+
+
+# Top K slips of `legs` props from a scored board, best first. A slip's joint probability
+# is the product of its legs' AI_Prob and its payout the product of their decimal odds;
+# objective "ev" ranks by expected value (joint probability x payout - 1), "prob" by joint
+# probability alone. Within a slip no player repeats and no two legs share an opponent;
+# across slips no player repeats. Returns [{"legs", "joint_prob", "payout", "ev"}].
+# joint(props, slips) -> hit probabilities (e.g. joint_probability.slip_probability)
+# re-ranks the final beam when legs aren't independent.
+def optimize_slips(board, legs, top_k=TOP_K, beam_width=BEAM_WIDTH, objective="ev", joint=None,
+                   prob_col="AI_Prob", odds_col="Best_Odds", player_col="Player", opponent_col="Opponent"):
+    prob = pd.to_numeric(board[prob_col], errors="coerce").to_numpy(dtype="float64") / 100
+    payout = decimal_odds(board[odds_col])
+    usable = (prob > 0) & (payout > 1)
+    prob, payout, props = prob[usable], payout[usable], board[usable]
+
+    leg_score = np.log(prob) + (np.log(payout) if objective == "ev" else 0.0)
+    order = np.argsort(-leg_score, kind="stable")
+    prob, payout, leg_score, props = prob[order], payout[order], leg_score[order], props.iloc[order]
+    player = _codes(props[player_col])
+    opponent = _codes(props[opponent_col])
+
+    slips = []
+    available = np.ones(len(props), dtype=bool)
+    while len(slips) < top_k:
+        positions = np.flatnonzero(available)
+        if len(positions) < legs:
+            break
+        beams = _beam_search(leg_score[positions], player[positions], opponent[positions], legs, beam_width)
+        if beams is None:
+            break
+        candidates = positions[beams]
+        hit_prob = prob[candidates].prod(axis=1) if joint is None else joint(props, candidates)
+        slip_payouts = payout[candidates].prod(axis=1)
+        score = hit_prob * slip_payouts if objective == "ev" else hit_prob
+        best = int(np.argmax(score))  # first on ties: the beam's own order
+        chosen = candidates[best]
+        joint_prob = float(hit_prob[best])
+        slip_payout = float(slip_payouts[best])
+        slips.append({
+            "legs": props.iloc[chosen],
+            "joint_prob": joint_prob,
+            "payout": slip_payout,
+            "ev": joint_prob * slip_payout - 1,
+        })
+        available &= ~np.isin(player, player[chosen])
+    return slips
@@ -0,0 +1,62 @@
+import os
+
+import pandas as pd
+
+# Stat categories the pipeline knows about. Adding one (e.g. PRA, threes) is a new entry:
+#   label   - Category value used on the board and in the app
+#   name    - spelling used in the Player_<name>_L10_H2H.csv file names
+#   key     - suffix of the L10_/H2H_ columns
+#   columns - game-log columns summed into the stat
+STAT_TYPES = {
+    "POINTS": {"label": "Points", "name": "Points", "key": "PTS", "columns": ["PTS"]},
+    "REBOUNDS": {"label": "Rebounds", "name": "Rebounds", "key": "REB", "columns": ["REB"]},
+    "ASSISTS": {"label": "Assists", "name": "Assists", "key": "AST", "columns": ["AST"]},
+}
+
+
+def l10_h2h_file(category):
+    return f"Player_{STAT_TYPES[category]['name']}_L10_H2H.csv"
+
+
+# Read every per-category file that exists and stack them with a Category column
+# (an empty table with `columns` when none exist yet)
+def _stack(path_for, prepare, columns):
+    frames = []
+    for category, stat in STAT_TYPES.items():
+        path = path_for(category)
+        if not os.path.exists(path):
+            print(f"⚠️ {path} not found, no {stat['label']} rows.")
+            continue
+        frame = prepare(pd.read_csv(path), stat)
+        frame["Category"] = stat["label"]
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=columns + ["Category"])
+    return pd.concat(frames, ignore_index=True)
+
+
+# Player, Category, Opponent, L10, H2H
+def load_l10_h2h_long():
+    return _stack(l10_h2h_file, lambda df, stat: df.rename(
+        columns={f"L10_{stat['key']}": "L10", f"H2H_{stat['key']}": "H2H"}),
+        ["Player", "Team", "Opponent", "L10", "H2H"])
+
+
+# Player, Category, Best_Over_Odds, Best_Under_Odds, Best_Point, ... (clean_odds.py output)
+def load_odds_long():
+    return _stack(lambda category: f"Cleaned_Best_Odds_{category}.csv", lambda df, stat: df,
+                  ["Player", "Best_Over_Odds", "Best_Under_Odds", "Best_Point", "Best_Over_Book",
+                   "Best_Under_Book", "Books", "Consensus_Over_Prob", "Consensus_Under_Prob"])
+
+
+# Player, Category, AI_Projection, ... (generate_ai_projections.py output)
+def load_projections_long():
+    return _stack(lambda category: f"AI_Projections_{category}.csv", lambda df, stat: df.drop(columns="Category", errors="ignore"),
+                  ["Player", "AI_Projection", "STDDEV", "Model"])
+
+
+# Write one file per category from a long table, e.g. Final_Projections_POINTS.csv
+def write_category_views(df, prefix):
+    for category, stat in STAT_TYPES.items():
+        view = df[df["Category"] == stat["label"]].drop(columns="Category")
+        view.to_csv(f"{prefix}_{category}.csv", index=False)
@@ -0,0 +1,117 @@
+# Local stand-in for stats.nba.com so the fetchers can be exercised offline.
+#
+#   python stub_stats_server.py --port 8765 --fail-rate 0.1 --latency 0.2
+#   NBA_STATS_BASE_URL="http://127.0.0.1:8765/stats/{endpoint}" python l10_h2h_today.py
+#
+# Serves deterministic fake game logs (seeded by player and season) and a scoreboard
+# where every team plays. --fail-rate answers that fraction of requests with a 429.
+import argparse
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from nba_api.stats.static import players, teams
+
+GAME_LOG_HEADERS = ["SEASON_YEAR", "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION",
+                    "GAME_ID", "GAME_DATE", "MATCHUP", "MIN", "PTS", "REB", "AST"]
+
+TEAMS = sorted(teams.get_teams(), key=lambda t: t["id"])
+
+
+def team_for(player_id):
+    return TEAMS[player_id % len(TEAMS)]
+
+
+def fake_game_logs(player_id, season, date_from=None):
+    rng = random.Random(f"{player_id}-{season}")
+    player = players.find_player_by_id(player_id)
+    team = team_for(player_id)
+    start = date(int(season[:4]), 10, 24)
+    base_pts, base_reb, base_ast = rng.uniform(5, 28), rng.uniform(2, 11), rng.uniform(1, 9)
+
+    rows = []
+    for game in range(60):
+        game_date = start + timedelta(days=game * 2)
+        opponent = rng.choice([t for t in TEAMS if t["id"] != team["id"]])
+        home = rng.random() < 0.5
+        matchup = f"{team['abbreviation']} {'vs.' if home else '@'} {opponent['abbreviation']}"
+        rows.append([season, player_id, player["full_name"] if player else str(player_id),
+                     team["id"], team["abbreviation"], f"00{season[2:4]}{player_id % 1000:03d}{game:03d}",
+                     game_date.isoformat() + "T00:00:00", matchup, rng.randint(15, 38),
+                     max(0, round(rng.gauss(base_pts, 5))), max(0, round(rng.gauss(base_reb, 2.5))),
+                     max(0, round(rng.gauss(base_ast, 2)))])
+    # Filter after generating so every request sees the same games
+    if date_from:
+        rows = [row for row in rows if date.fromisoformat(row[6][:10]) >= date_from]
+    rows.reverse()  # newest first, like the real endpoint
+    return rows
+
+
+def scoreboard():
+    games = [{"GAME_ID": f"00{i:08d}", "HOME_TEAM_ID": TEAMS[i]["id"],
+              "VISITOR_TEAM_ID": TEAMS[i + 1]["id"]} for i in range(0, len(TEAMS), 2)]
+    headers = ["GAME_ID", "HOME_TEAM_ID", "VISITOR_TEAM_ID"]
+    result_sets = [{"name": "GameHeader", "headers": headers,
+                    "rowSet": [[g[h] for h in headers] for g in games]}]
+    # nba_api expects every ScoreboardV2 data set to be present, even if empty
+    for name in ["Available", "EastConfStandingsByDay", "LastMeeting", "LineScore", "SeriesStandings",
+                 "TeamLeaders", "TicketLinks", "WestConfStandingsByDay", "WinProbability"]:
+        result_sets.append({"name": name, "headers": [], "rowSet": []})
+    return {"resultSets": result_sets}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    fail_rate = 0.0
+    latency = 0.0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        time.sleep(self.latency)
+
+        if random.random() < self.fail_rate:
+            return self.send_body(429, "Too Many Requests", "text/plain")
+
+        endpoint = url.path.rstrip("/").split("/")[-1].lower()
+        if endpoint == "playergamelogs":
+            season = params.get("Season", "2024-25")
+            date_from = params.get("DateFrom")
+            date_from = datetime.strptime(date_from, "%m/%d/%Y").date() if date_from else None
+            if params.get("PlayerID"):
+                player_ids = [int(params["PlayerID"])]
+            else:
+                player_ids = [p["id"] for p in players.get_active_players()]
+            rows = [row for pid in player_ids for row in fake_game_logs(pid, season, date_from)]
+            body = {"resultSets": [{"name": "PlayerGameLogs", "headers": GAME_LOG_HEADERS, "rowSet": rows}]}
+        elif endpoint == "scoreboardv2":
+            body = scoreboard()
+        else:
+            return self.send_body(404, "Unknown endpoint", "text/plain")
+        self.send_body(200, json.dumps(body), "application/json")
+
+    def send_body(self, status, text, content_type):
+        payload = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub stats.nba.com server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    StubHandler.fail_rate = args.fail_rate
+    StubHandler.latency = args.latency
+    print(f"🧪 Stub stats server on http://127.0.0.1:{args.port}/stats/{{endpoint}}")
+    ThreadingHTTPServer(("127.0.0.1", args.port), StubHandler).serve_forever()
@@ -0,0 +1,54 @@
+import pandas as pd
+
+from clean_odds import load_odds, process_file
+from odds_history import closing_lines, movement, prop_movement, record_odds
+
+
+# A dump in the repo's format (no book column): each quote is an Over row and its Under row
+def dump(quotes, path="NBA STATS - POINTS.csv"):
+    rows = [row for player, line, over, under in quotes
+            for row in [["Over", player, over, line], ["Under", player, under, line]]]
+    pd.DataFrame(rows).to_csv(path, header=False, index=False)
+    return load_odds(path)
+
+
+def moves():
+    return prop_movement().set_index("Player")
+
+
+def test_line_move_in_a_bookless_dump(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    record_odds(dump([("A", 10.5, -110, -110), ("A", 10.5, -115, -105), ("A", 12.5, 150, -190)]),
+                "Points", ts="2025-01-01T10:00", full=True)
+    record_odds(dump([("A", 11.5, -110, -110), ("A", 11.5, -112, -108), ("A", 12.5, 150, -190)]),
+                "Points", ts="2025-01-01T15:00", full=True)
+    assert moves().loc["A", "Line_Delta"] == 1.0
+
+
+def test_alternate_lines_dont_move_the_prop(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    main = [("A", 10.5, -110, -110), ("A", 10.5, -115, -105)]
+    record_odds(dump(main), "Points", ts="2025-01-01T10:00", full=True)
+    added = record_odds(dump([("A", 7.5, -300, 200)] + main + [("A", 13.5, 200, -300)]),
+                        "Points", ts="2025-01-01T11:00", full=True)
+    assert added == 0
+    assert moves().loc["A", ["Line_Delta", "Price_Delta"]].tolist() == [0.0, 0.0]
+
+
+# Closed between games: the next game's quote opens fresh instead of moving from the last one
+def test_reopened_quote_opens_again(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    record_odds(dump([("A", 10.5, -110, -110), ("B", 5.5, -110, -110)]), "Points", ts="2025-01-01T10:00", full=True)
+    record_odds(dump([("B", 5.5, -110, -110)]), "Points", ts="2025-01-03T10:00", full=True)
+    assert set(movement()["player"]) == {"B"}
+    assert set(closing_lines("2025-01-03T12:00")["player"]) == {"B"}
+
+    record_odds(dump([("A", 20.5, -130, 100), ("B", 5.5, -110, -110)]), "Points", ts="2025-01-05T10:00", full=True)
+    assert moves().loc["A", ["Line_Delta", "Price_Delta"]].tolist() == [0.0, 0.0]
+
+
+def test_empty_dump(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame([["label", "description", "price", "point"]]).to_csv("NBA STATS - POINTS.csv", header=False, index=False)
+    assert record_odds(load_odds("NBA STATS - POINTS.csv"), "Points") == 0
+    assert process_file("NBA STATS - POINTS.csv").empty
@@ -0,0 +1,72 @@
+import pandas as pd
+
+from odds_stream import OddsBook
+
+
+def board():
+    return pd.DataFrame({
+        "Player": ["Aaron Nesmith"], "Team": ["IND"], "Opponent": ["OKC"], "Category": ["Points"],
+        "AI_Projection": [12.0], "L10": [11.0], "H2H": [10.0], "DEF RTG RANK": [15], "STDDEV": [4.0],
+        "Best_Line": [10.5], "Best_Over_Odds": [-110], "Best_Under_Odds": [-110], "Books": [1], "Edge": [1.5],
+    })
+
+
+def quote(book, side, line, price):
+    return {"category": "POINTS", "player": "Aaron Nesmith", "book": book, "side": side, "line": line, "price": price}
+
+
+# dk and fd both move 10.5 -> 12.5: the old line must drop out, not keep winning on book count
+def test_line_move_replaces_the_books_old_line(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # No odds history here
+    book = OddsBook(board())
+    for update in [quote("dk", "Over", 10.5, -115), quote("dk", "Under", 10.5, -105),
+                   quote("fd", "Over", 10.5, -120), quote("fd", "Under", 10.5, -110)]:
+        book.apply(update)
+    book.rescore({("Aaron Nesmith", "Points")})
+    assert book.board.loc[0, "Best_Line"] == 10.5
+
+    for update in [quote("dk", "Over", 12.5, 105), quote("dk", "Under", 12.5, -135),
+                   quote("fd", "Over", 12.5, 110), quote("fd", "Under", 12.5, -140)]:
+        book.apply(update)
+    book.rescore({("Aaron Nesmith", "Points")})
+
+    row = book.board.loc[0]
+    assert row["Best_Line"] == 12.5
+    assert row["Books"] == 2
+    assert row["Best_Over_Odds"] == 105
+    assert row["Best_Under_Odds"] == -135
+    assert row["Edge"] == 12.0 - 12.5
+    assert len(book.quotes[("Aaron Nesmith", "Points")]) == 4
+
+
+# Seeded quotes are keyed the same way: a streamed update replaces that book's seeded line
+def test_update_replaces_a_seeded_quote(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame([["Over", "Aaron Nesmith", -115, 10.5, "dk"], ["Under", "Aaron Nesmith", -105, 10.5, "dk"],
+                  ["Over", "Aaron Nesmith", 150, 12.5, "dk"], ["Under", "Aaron Nesmith", -190, 12.5, "dk"]]
+                 ).to_csv("NBA STATS - POINTS.csv", header=False, index=False)
+    book = OddsBook(board())
+    book.seed()
+    assert book.quotes[("Aaron Nesmith", "Points")][("dk", "Over")] == (10.5, -115, "dk")
+
+    book.apply(quote("dk", "Over", 11.5, -110))
+    book.apply(quote("dk", "Under", 11.5, -110))
+    book.rescore({("Aaron Nesmith", "Points")})
+    assert book.board.loc[0, "Best_Line"] == 11.5
+    assert len(book.quotes[("Aaron Nesmith", "Points")]) == 2
+
+
+# A board republished by the pipeline becomes the base; the streamed odds are re-applied on it
+def test_new_base_board_keeps_the_streamed_odds(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    book = OddsBook(board())
+    book.apply(quote("dk", "Over", 11.5, -120))
+    book.apply(quote("dk", "Under", 11.5, -110))
+
+    book.set_board(board().assign(AI_Projection=14.0))
+    book.rescore(book.streamed)
+
+    row = book.board.loc[0]
+    assert row["AI_Projection"] == 14.0
+    assert row["Best_Line"] == 11.5
+    assert row["Edge"] == 14.0 - 11.5
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import norm
+
+from scoring import score_board
+
+
+# The per-row functions score_board replaced, as app.py had them
+def get_best_bet(row):
+    if row["Edge"] > 0 and row["Best_Over_Odds"] <= -110:
+        return "Over", row["Best_Over_Odds"]
+    elif row["Edge"] < 0 and row["Best_Under_Odds"] <= -110:
+        return "Under", row["Best_Under_Odds"]
+    else:
+        return "Fade", None
+
+
+def calculate_confidence(row, best_odds):
+    edge_score = min(max(abs(row["Edge"]), 0), 1)
+    l10_diff = row["L10"] - row["Best_Line"]
+    l10_score = min(max(l10_diff / row["Best_Line"], 0), 1)
+    odds_score = 1 if best_odds >= -115 else 0.5 if best_odds >= -130 else 0.3
+
+    defense_penalty = 0
+    if not pd.isna(row.get("DEF RTG RANK")) and row["DEF RTG RANK"] <= 10:
+        defense_penalty = 0.2
+
+    confidence = (edge_score * 0.4 + l10_score * 0.4 + odds_score * 0.2)
+    confidence = confidence * (1 - defense_penalty)
+    return int(min(max(confidence * 100, 10), 100))
+
+
+def calculate_probability(row):
+    projection = row['AI_Projection']
+    line = row['Best_Line']
+    std_dev = row.get('STDDEV', 4.0)
+    z = (projection - line) / std_dev
+    prob_over = 1 - norm.cdf(z)
+    prob_under = norm.cdf(z)
+    return round(prob_over * 100), round(prob_under * 100)
+
+
+def matchup_note(row):
+    team = row.get("TEAM", "Unknown")
+    rank = row.get("DEF RTG RANK", None)
+    if pd.isna(rank) or pd.isna(team):
+        return "Matchup data unavailable"
+    rank = int(rank)
+    if rank >= 20:
+        return f"Great matchup ({team} #{rank})"
+    elif rank <= 10:
+        return f"Tough matchup ({team} #{rank})"
+    else:
+        return f"Neutral matchup ({team} #{rank})"
+
+
+def is_valid_value_pick(row):
+    over_under, best_odds = get_best_bet(row)
+    if over_under == "Fade" or best_odds is None:
+        return False
+    prob_over, prob_under = calculate_probability(row)
+    prob = prob_over if over_under == "Over" else prob_under
+    return prob >= 35
+
+
+def board():
+    rows = [
+        # Edge, Over, Under, DEF RTG RANK
+        (1.5, -110, -110, 15),      # Over at exactly -110
+        (-2.0, -120, -110, 25),     # Under at exactly -110
+        (0.8, -105, -125, 12),      # Over too cheap, positive edge: Fade
+        (-0.6, -140, -105, 3),      # Under too cheap: Fade
+        (0.0, -130, -130, 10),      # No edge: Fade
+        (2.5, -115, -105, np.nan),  # Odds exactly -115, no defense rank
+        (3.0, -130, 100, 20),       # Odds exactly -130
+        (-4.0, 120, -131, 5),       # Under just past -130
+        (0.3, -116, -110, 1),       # Just past -115, top defense
+        (-1.2, -110, -115, np.nan),
+    ]
+    df = pd.DataFrame(rows, columns=["Edge", "Best_Over_Odds", "Best_Under_Odds", "DEF RTG RANK"])
+    df["Best_Line"] = [10.5, 22.5, 4.5, 7.5, 18.5, 12.5, 25.5, 8.5, 5.5, 14.5]
+    df["AI_Projection"] = df["Best_Line"] + df["Edge"]
+    df["L10"] = df["Best_Line"] + [2.0, -1.0, 0.5, -3.0, 0.0, 20.0, 1.0, -2.0, 0.2, 0.0]
+    df["STDDEV"] = [4.0, 6.5, 1.5, 2.0, 5.0, 3.0, 7.0, 2.5, 1.0, 4.0]
+    df["Opponent"] = ["BOS", "LAL", "MIA", "OKC", "IND", "DEN", "NYK", "PHX", "CLE", np.nan]
+    df["TEAM"] = df["Opponent"].where(df["DEF RTG RANK"].notna())  # As the defense merge left it
+    return df
+
+
+@pytest.mark.parametrize("i", range(len(board())))
+def test_score_board_matches_the_per_row_functions(i):
+    row = board().iloc[i]
+    scored = score_board(board().drop(columns="TEAM")).iloc[i]
+
+    bet, best_odds = get_best_bet(row)
+    prob_over, prob_under = calculate_probability(row)
+    assert scored["Bet"] == bet
+    assert (pd.isna(scored["Best_Odds"]) if best_odds is None else scored["Best_Odds"] == best_odds)
+    assert (scored["Prob_Over"], scored["Prob_Under"]) == (prob_over, prob_under)
+    assert scored["Matchup"] == matchup_note(row)
+    assert scored["Valid_Value"] == is_valid_value_pick(row)
+    if bet != "Fade":
+        assert scored["AI_Prob"] == (prob_over if bet == "Over" else prob_under)
+        assert scored["Confidence"] == calculate_confidence(row, best_odds)